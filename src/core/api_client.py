@@ -2,6 +2,7 @@
 HTTP API client with retry logic and rate limiting for Coralogix API.
 """
 
+import threading
 import time
 from typing import Dict, Any, Optional, List
 import httpx
@@ -10,14 +11,22 @@ import structlog
 
 from .config import Config
 
+try:
+    import h2  # noqa: F401  # httpx only negotiates HTTP/2 when the h2 package is installed
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - HTTP/2 is an optional speedup
+    HTTP2_AVAILABLE = False
+
 
 class CoralogixAPIError(Exception):
     """Custom exception for Coralogix API errors."""
     
-    def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None):
+    def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None,
+                 retry_after: Optional[float] = None):
         super().__init__(message)
         self.status_code = status_code
         self.response_data = response_data
+        self.retry_after = retry_after  # Seconds from the Retry-After header, if the server sent one
 
 
 class APIClient:
@@ -45,27 +54,33 @@ class APIClient:
         else:
             raise ValueError(f"Invalid team: {team}. Must be 'teama' or 'teamb'")
         
-        # Initialize HTTP client
+        # Initialize HTTP client. The pool is sized for the services' worker pools so
+        # concurrent requests reuse kept-alive connections instead of opening new ones,
+        # and HTTP/2 multiplexes them over a single connection when the server supports it.
         self.client = httpx.Client(
             base_url=self.base_url,
             headers=self.headers,
-            timeout=30.0
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            http2=HTTP2_AVAILABLE
         )
         
-        # Rate limiting
+        # Rate limiting (the lock keeps the spacing correct when requests come from several threads)
         self.last_request_time = 0
         self.min_request_interval = 1.0 / config.api_rate_limit_per_second
+        self._rate_limit_lock = threading.Lock()
     
     def _rate_limit(self):
         """Implement rate limiting."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
+
+            if time_since_last_request < self.min_request_interval:
+                sleep_time = self.min_request_interval - time_since_last_request
+                time.sleep(sleep_time)
+
+            self.last_request_time = time.time()
     
     @retry(
         stop=stop_after_attempt(3),
@@ -146,10 +161,18 @@ class APIClient:
                 response_text=e.response.text[:500]  # First 500 chars
             )
 
+            # Retry-After may also be an HTTP date; only the delay-seconds form is used
+            retry_after = None
+            try:
+                retry_after = float(e.response.headers.get('Retry-After', ''))
+            except ValueError:
+                pass
+
             raise CoralogixAPIError(
                 error_message,
                 status_code=e.response.status_code,
-                response_data=error_data
+                response_data=error_data,
+                retry_after=retry_after
             )
         
         except httpx.RequestError as e:
@@ -171,9 +194,10 @@ class APIClient:
         return response.json()
     
     def post(self, endpoint: str, json_data: Optional[Dict] = None,
-             data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make POST request."""
-        response = self._make_request("POST", endpoint, json=json_data, data=data, params=params)
+             data: Optional[Dict] = None, params: Optional[Dict] = None,
+             headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Make POST request. Extra headers are merged over the client's default headers."""
+        response = self._make_request("POST", endpoint, json=json_data, data=data, params=params, headers=headers)
         return response.json()
     
     def put(self, endpoint: str, json_data: Optional[Dict] = None) -> Dict[str, Any]:
@@ -2,14 +2,15 @@
 Base service class for all migration services.
 """
 
-import json
 import os
+import shutil
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import structlog
 
+from . import json_utils
 from .config import Config
 from .api_client import APIClient, CoralogixAPIError
 from .logger import LoggerMixin
@@ -97,8 +98,8 @@ class BaseService(LoggerMixin, ABC):
             }
         
         try:
-            with open(state_file, 'r') as f:
-                return json.load(f)
+            with open(state_file, 'rb') as f:
+                return json_utils.loads(f.read())
         except Exception as e:
             self.logger.warning(f"Failed to load state file: {e}")
             return {
@@ -112,8 +113,8 @@ class BaseService(LoggerMixin, ABC):
         state_file = self.get_state_file_path()
         
         try:
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2, default=str)
+            with open(state_file, 'wb') as f:
+                f.write(json_utils.dumps(state, indent=True))
             
             self.logger.info(f"State saved to {state_file}")
         except Exception as e:
@@ -132,8 +133,8 @@ class BaseService(LoggerMixin, ABC):
         }
 
         try:
-            with open(snapshot_file, 'w') as f:
-                json.dump(snapshot_data, f, indent=2, default=str)
+            with open(snapshot_file, 'wb') as f:
+                f.write(json_utils.dumps(snapshot_data, indent=True))
 
             self.logger.info(f"Snapshot saved to {snapshot_file}")
             return snapshot_file
@@ -146,23 +147,21 @@ class BaseService(LoggerMixin, ABC):
         artifact_file = self.get_artifact_file_path(team, timestamp)
         latest_artifact_file = self.get_latest_artifact_file_path(team)
 
-        artifact_data = {
+        metadata = {
             "timestamp": datetime.now().isoformat(),
             "service": self.service_name,
             "team": team,
-            "resources": resources,
             "count": len(resources),
             "resource_identifiers": [self.get_resource_identifier(r) for r in resources]
         }
 
         try:
             # Save timestamped version
-            with open(artifact_file, 'w') as f:
-                json.dump(artifact_data, f, indent=2, default=str)
+            with open(artifact_file, 'wb') as f:
+                self._write_artifact_document(f, metadata, resources)
 
             # Save latest version (for easy comparison)
-            with open(latest_artifact_file, 'w') as f:
-                json.dump(artifact_data, f, indent=2, default=str)
+            shutil.copyfile(artifact_file, latest_artifact_file)
 
             self.logger.info(f"Artifacts saved to {artifact_file}")
             self.logger.info(f"Latest artifacts saved to {latest_artifact_file}")
@@ -171,6 +170,32 @@ class BaseService(LoggerMixin, ABC):
             self.logger.error(f"Failed to save artifacts: {e}")
             raise
     
+    @staticmethod
+    def _write_artifact_document(f, metadata: Dict[str, Any], resources: Iterable[Dict[str, Any]]):
+        """
+        Stream an artifact JSON document to a binary file.
+
+        Resources are serialized and written one at a time, so the full
+        document is never held in memory as a single string. The output is
+        still one JSON object, readable by load_artifacts().
+
+        Args:
+            f: File opened in binary write mode
+            metadata: Top-level fields written before the resources
+            resources: Resources to write under the "resources" key
+        """
+        f.write(b'{\n')
+        for key, value in metadata.items():
+            f.write(b'  ' + json_utils.dumps(key) + b': ' + json_utils.dumps(value) + b',\n')
+
+        f.write(b'  "resources": [')
+        separator = b'\n    '
+        for resource in resources:
+            f.write(separator)
+            f.write(json_utils.dumps(resource))
+            separator = b',\n    '
+        f.write(b'\n  ]\n}\n')
+
     @abstractmethod
     def fetch_resources_from_teama(self) -> List[Dict[str, Any]]:
         """Fetch all resources from Team A."""
@@ -255,8 +280,8 @@ class BaseService(LoggerMixin, ABC):
             }
 
         try:
-            with open(artifact_file, 'r') as f:
-                return json.load(f)
+            with open(artifact_file, 'rb') as f:
+                return json_utils.loads(f.read())
         except Exception as e:
             self.logger.warning(f"Failed to load artifacts for {team}: {e}")
             return {
@@ -49,6 +49,26 @@ class Config(BaseModel):
         default=2.0, 
         description="Backoff factor for retries"
     )
+    parsing_rules_parallelism: int = Field(
+        default=8,
+        description="Maximum concurrent parsing rule group deletions"
+    )
+    parsing_rules_mode: str = Field(
+        default="recreate_all",
+        description="Parsing rules sync strategy: 'recreate_all' or 'diff_sync'"
+    )
+    recording_rules_parallelism: int = Field(
+        default=8,
+        description="Maximum concurrent recording rule group set deletions and creations"
+    )
+    slo_delete_parallelism: int = Field(
+        default=5,
+        description="Maximum concurrent SLO deletions"
+    )
+    recording_rules_order_insensitive: bool = Field(
+        default=True,
+        description="Ignore the order of groups within a recording rule group set when comparing sets"
+    )
     
     # Storage Configuration
     state_storage_path: str = Field(
@@ -67,6 +87,10 @@ class Config(BaseModel):
         default="./logs",
         description="Path to store log files"
     )
+    persist_dry_run_artifacts: bool = Field(
+        default=True,
+        description="Save Team A/B artifacts during dry runs (read by the run summary and the compare command)"
+    )
 
     # Safety Configuration
     safety_storage_path: str = Field(
@@ -112,10 +136,16 @@ class Config(BaseModel):
             'api_rate_limit_per_second': int(os.getenv('API_RATE_LIMIT_PER_SECOND', '10')),
             'api_retry_max_attempts': int(os.getenv('API_RETRY_MAX_ATTEMPTS', '3')),
             'api_retry_backoff_factor': float(os.getenv('API_RETRY_BACKOFF_FACTOR', '2.0')),
+            'parsing_rules_parallelism': int(os.getenv('PARSING_RULES_PARALLELISM', '8')),
+            'parsing_rules_mode': os.getenv('PARSING_RULES_MODE', 'recreate_all'),
+            'recording_rules_parallelism': int(os.getenv('RECORDING_RULES_PARALLELISM', '8')),
+            'slo_delete_parallelism': int(os.getenv('SLO_DELETE_PARALLELISM', '5')),
+            'recording_rules_order_insensitive': os.getenv('RECORDING_RULES_ORDER_INSENSITIVE', 'true').lower() == 'true',
             'state_storage_path': os.getenv('STATE_STORAGE_PATH', './state'),
             'snapshots_storage_path': os.getenv('SNAPSHOTS_STORAGE_PATH', './snapshots'),
             'outputs_storage_path': os.getenv('OUTPUTS_STORAGE_PATH', './outputs'),
             'logs_storage_path': os.getenv('LOGS_STORAGE_PATH', './logs'),
+            'persist_dry_run_artifacts': os.getenv('PERSIST_DRY_RUN_ARTIFACTS', 'true').lower() == 'true',
             'safety_storage_path': os.getenv('SAFETY_STORAGE_PATH', './safety'),
             'versions_storage_path': os.getenv('VERSIONS_STORAGE_PATH', './versions'),
             'min_resources_threshold': int(os.getenv('MIN_RESOURCES_THRESHOLD', '1')),
@@ -0,0 +1,49 @@
+"""
+JSON helpers for the Coralogix DR Tool.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise, so callers don't need to care which one is available.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Unknown types are serialized with str(), matching the json.dump(default=str)
+    calls used throughout the tool.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a 2 space indent
+        sort_keys: Sort object keys, for a canonical encoding
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option)
+    # Compact separators, as orjson emits, keep JSON Lines and payload encodings small
+    separators = None if indent else (',', ':')
+    return json.dumps(obj, indent=2 if indent else None, separators=separators,
+                      sort_keys=sort_keys, default=str).encode('utf-8')
@@ -0,0 +1,56 @@
+"""
+Token bucket rate limiter for pacing API operations.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that allows bursts up to capacity and refills at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+
+    def set_rate(self, rate: float, drain: bool = False):
+        """
+        Change the refill rate.
+
+        Args:
+            rate: New tokens added per second
+            drain: Drop any banked tokens so the new rate applies immediately
+        """
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            if drain:
+                self._tokens = 0.0
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import structlog
 
+from . import json_utils
 from .config import Config
 
 
@@ -76,8 +77,8 @@ class VersionManager:
         version_file = self.service_versions_dir / f'{version_id}.json'
         
         try:
-            with open(version_file, 'w') as f:
-                json.dump(version_data, f, indent=2, default=str)
+            with open(version_file, 'wb') as f:
+                f.write(json_utils.dumps(version_data, indent=True))
             
             # Update current and previous version links
             self._update_version_links(version_id)
@@ -108,8 +109,8 @@ class VersionManager:
             return None
         
         try:
-            with open(version_file, 'r') as f:
-                return json.load(f)
+            with open(version_file, 'rb') as f:
+                return json_utils.loads(f.read())
         except Exception as e:
             self.logger.error(f"Failed to load version {version_id}: {e}")
             return None
@@ -170,8 +171,8 @@ class VersionManager:
             
             for version_file in version_files:
                 try:
-                    with open(version_file, 'r') as f:
-                        data = json.load(f)
+                    with open(version_file, 'rb') as f:
+                        data = json_utils.loads(f.read())
                     
                     # Extract metadata for listing
                     versions.append({
@@ -5,17 +5,67 @@ This service integrates the existing shell scripts (import.sh and exports.sh)
 to migrate Grafana dashboards and folders between teams.
 """
 
+import atexit
 import json
 import os
 import subprocess
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
+from core import json_utils
 from core.base_service import BaseService
 
 
+# Table dividers and the label/value row format used by the result summaries
+_DIVIDER_EQ = "=" * 80
+_DIVIDER_DASH = "─" * 40
+_SUMMARY_ROW = "{label:<25} {value:>10}"
+
+# Failed-operation logs are written off the migration's critical path; the
+# executor is drained at interpreter exit so no log is lost.
+_log_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grafana-log-writer")
+atexit.register(_log_writer.shutdown, wait=True)
+
+
+class OpStatus(IntEnum):
+    """Outcome of a migration operation."""
+    SUCCESS = 0
+    WARNING = 1
+    FAILURE = 2
+    SKIPPED = 3
+
+
+# Status labels and log markers for interactive terminals, with plain ASCII
+# equivalents for non-interactive runs (CI, log shippers)
+_EMOJI_STATUS_LABELS = {
+    OpStatus.SUCCESS: '✅ Success',
+    OpStatus.WARNING: '⚠️ Warning',
+    OpStatus.FAILURE: '❌ Failed',
+    OpStatus.SKIPPED: '⏭️ Skipped',
+}
+_ASCII_STATUS_LABELS = {
+    OpStatus.SUCCESS: '[OK] Success',
+    OpStatus.WARNING: '[WARN] Warning',
+    OpStatus.FAILURE: '[FAIL] Failed',
+    OpStatus.SKIPPED: '[SKIP] Skipped',
+}
+_EMOJI_MARKERS = {'step': '🔄', 'ok': '✅', 'done': '🎉', 'warn': '⚠️'}
+_ASCII_MARKERS = {'step': '[STEP]', 'ok': '[OK]', 'done': '[DONE]', 'warn': '[WARN]'}
+
+
+class MigrationOp(NamedTuple):
+    """A single row of the migration results table."""
+    operation: str
+    status: str
+    details: str
+    status_code: OpStatus
+
+
 class GrafanaDashboardsService(BaseService):
     """Service for migrating Grafana dashboards between teams using shell scripts."""
 
@@ -91,9 +141,16 @@ class GrafanaDashboardsService(BaseService):
         self.failed_operations.append(failed_operation)
         self.logger.error(f"Failed {operation}: {error}")
 
-    def _save_failed_operations_log(self):
-        """Save failed operations to a log file for review."""
-        if not self.failed_operations:
+    def _save_failed_operations_log(self, failed_operations: Optional[List[Dict[str, Any]]] = None):
+        """
+        Save failed operations to a log file for review.
+
+        Args:
+            failed_operations: Failed operations to save, defaults to self.failed_operations
+        """
+        if failed_operations is None:
+            failed_operations = self.failed_operations
+        if not failed_operations:
             return
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -102,8 +159,8 @@ class GrafanaDashboardsService(BaseService):
         failed_data = {
             'timestamp': datetime.now().isoformat(),
             'service': self.service_name,
-            'failed_operations': self.failed_operations,
-            'total_failed_operations': len(self.failed_operations)
+            'failed_operations': failed_operations,
+            'total_failed_operations': len(failed_operations)
         }
 
         try:
@@ -114,6 +171,14 @@ class GrafanaDashboardsService(BaseService):
         except Exception as e:
             self.logger.error(f"Failed to save failed operations log: {e}")
 
+    def _save_failed_operations_log_in_background(self):
+        """Queue the failed operations log to be written on the background log writer."""
+        if not self.failed_operations:
+            return
+
+        # Hand over a snapshot so later failures don't race with the write
+        _log_writer.submit(self._save_failed_operations_log, list(self.failed_operations))
+
     def _run_shell_script(self, script_path: Path, script_name: str) -> Tuple[bool, str, str]:
         """
         Run a shell script and return the result.
@@ -173,10 +238,79 @@ class GrafanaDashboardsService(BaseService):
             self.logger.error(error_msg)
             return False, "", error_msg
 
+    def _count_json_files_in_directory(self, directory: Path) -> int:
+        """
+        Count JSON files in a directory without loading them.
+
+        Args:
+            directory: Directory containing JSON files
+
+        Returns:
+            Number of JSON files, or 0 if the directory does not exist
+        """
+        if not directory.exists():
+            return 0
+
+        with os.scandir(directory) as entries:
+            return sum(
+                1 for entry in entries
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+            )
+
+    def _load_json_file(self, json_file: Path, resource_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a single dashboard or folder JSON file.
+
+        Args:
+            json_file: Path to the JSON file
+            resource_type: Type of resource (dashboard or folder)
+
+        Returns:
+            Loaded resource, or None if the file could not be loaded
+        """
+        try:
+            self.logger.debug("Loading %s file: %s", resource_type, json_file)
+            # Read the raw bytes in one unbuffered call and hand them straight to the parser
+            with open(json_file, 'rb', buffering=0) as f:
+                data = json_utils.loads(f.read())
+
+            # Extract meaningful information based on resource type
+            if resource_type == 'dashboard':
+                # For dashboards, extract from the nested structure
+                if 'dashboard' in data:
+                    resource = data['dashboard']
+                else:
+                    # Fallback for different structure
+                    resource = data
+                default_title = 'Unknown Dashboard'
+            else:
+                # For folders, use the data directly
+                resource = data
+                default_title = 'Unknown Folder'
+
+            resource['_source_file'] = str(json_file)
+            resource['_resource_type'] = resource_type
+            resource['_uid'] = resource.get('uid', json_file.stem)
+            resource['_title'] = resource.get('title', default_title)
+
+            self.logger.debug("Loaded %s: %s", resource_type, resource['_title'])
+            return resource
+
+        except Exception as e:
+            self.logger.error(f"Failed to load {resource_type} file {json_file}: {e}")
+            self._log_failed_operation(
+                f"load_{resource_type}_file",
+                str(e),
+                {'file_path': str(json_file)}
+            )
+            return None
+
     def _load_json_files_from_directory(self, directory: Path, resource_type: str) -> List[Dict[str, Any]]:
         """
         Load JSON files from a directory.
 
+        Files are read concurrently since loading many small files is I/O bound.
+
         Args:
             directory: Directory containing JSON files
             resource_type: Type of resource (dashboards or folders)
@@ -190,53 +324,40 @@ class GrafanaDashboardsService(BaseService):
             self.logger.warning(f"{resource_type.title()} directory does not exist: {directory}")
             return resources
 
-        json_files = list(directory.glob("*.json"))
+        # A single scandir pass gives us the file type from the directory entry without a stat per file
+        with os.scandir(directory) as entries:
+            json_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+            ]
         self.logger.info(f"Found {len(json_files)} {resource_type} JSON files in {directory}")
 
-        for json_file in json_files:
-            try:
-                self.logger.debug(f"Loading {resource_type} file: {json_file}")
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-
-                    # Extract meaningful information based on resource type
-                    if resource_type == 'dashboard':
-                        # For dashboards, extract from the nested structure
-                        if 'dashboard' in data:
-                            dashboard_data = data['dashboard']
-                            dashboard_data['_source_file'] = str(json_file)
-                            dashboard_data['_resource_type'] = resource_type
-                            dashboard_data['_uid'] = dashboard_data.get('uid', json_file.stem)
-                            dashboard_data['_title'] = dashboard_data.get('title', 'Unknown Dashboard')
-                            resources.append(dashboard_data)
-                        else:
-                            # Fallback for different structure
-                            data['_source_file'] = str(json_file)
-                            data['_resource_type'] = resource_type
-                            data['_uid'] = data.get('uid', json_file.stem)
-                            data['_title'] = data.get('title', 'Unknown Dashboard')
-                            resources.append(data)
-                    else:
-                        # For folders, use the data directly
-                        data['_source_file'] = str(json_file)
-                        data['_resource_type'] = resource_type
-                        data['_uid'] = data.get('uid', json_file.stem)
-                        data['_title'] = data.get('title', 'Unknown Folder')
-                        resources.append(data)
-
-                    self.logger.debug(f"Loaded {resource_type}: {data.get('_title', 'Unknown')}")
-
-            except Exception as e:
-                self.logger.error(f"Failed to load {resource_type} file {json_file}: {e}")
-                self._log_failed_operation(
-                    f"load_{resource_type}_file",
-                    str(e),
-                    {'file_path': str(json_file)}
-                )
+        if json_files:
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(json_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = executor.map(lambda json_file: self._load_json_file(json_file, resource_type), json_files)
+                resources = [resource for resource in loaded if resource is not None]
 
         self.logger.info(f"Successfully loaded {len(resources)} {resource_type}")
         return resources
 
+    def _load_dashboards_and_folders(self, dashboards_dir: Path,
+                                     folders_dir: Path) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Load dashboards and folders from their directories concurrently.
+
+        Args:
+            dashboards_dir: Directory containing dashboard JSON files
+            folders_dir: Directory containing folder JSON files
+
+        Returns:
+            Tuple of (dashboards, folders)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dashboards_future = executor.submit(self._load_json_files_from_directory, dashboards_dir, "dashboard")
+            folders_future = executor.submit(self._load_json_files_from_directory, folders_dir, "folder")
+            return dashboards_future.result(), folders_future.result()
+
     def _clean_script_directories(self):
         """Clean up script output directories before running scripts."""
         try:
@@ -265,11 +386,11 @@ class GrafanaDashboardsService(BaseService):
 
         # Check if files already exist (skip script execution if they do)
         if self.dashboards_dir.exists() and self.folders_dir.exists():
-            existing_dashboards = list(self.dashboards_dir.glob("*.json"))
-            existing_folders = list(self.folders_dir.glob("*.json"))
+            existing_dashboards = self._count_json_files_in_directory(self.dashboards_dir)
+            existing_folders = self._count_json_files_in_directory(self.folders_dir)
 
             if existing_dashboards or existing_folders:
-                self.logger.info(f"Found existing files: {len(existing_dashboards)} dashboards, {len(existing_folders)} folders")
+                self.logger.info(f"Found existing files: {existing_dashboards} dashboards, {existing_folders} folders")
                 self.logger.info("Skipping script execution and loading existing files")
 
                 # Load dashboards and folders from existing files
@@ -557,7 +678,7 @@ exec "{self.export_script}"
 
         print(bottom_border)
 
-    def _display_migration_results_table(self, table_data: List[Dict[str, Any]]):
+    def _display_migration_results_table(self, table_data: List[MigrationOp]):
         """Display migration results in a nice tabular format."""
 
         # Table headers
@@ -569,9 +690,9 @@ exec "{self.export_script}"
 
         # Calculate column widths
         col_widths = [
-            max(len(headers[0]), max(len(row['operation']) for row in table_data)),
-            max(len(headers[1]), max(len(row['status']) for row in table_data)),
-            max(len(headers[2]), max(len(row['details']) for row in table_data))
+            max(len(headers[0]), max(len(row.operation) for row in table_data)),
+            max(len(headers[1]), max(len(row.status) for row in table_data)),
+            max(len(headers[2]), max(len(row.details) for row in table_data))
         ]
 
         # Ensure minimum width for readability
@@ -597,13 +718,7 @@ exec "{self.export_script}"
         # Data rows
         for row in table_data:
             data_row = "│"
-            values = [
-                row['operation'],
-                row['status'],
-                row['details']
-            ]
-
-            for i, value in enumerate(values):
+            for i, value in enumerate((row.operation, row.status, row.details)):
                 data_row += f" {value:<{col_widths[i]}} │"
 
             print(data_row)
@@ -682,12 +797,17 @@ exec "{self.export_script}"
             # Organize Team A resources
             teama_dashboards, teama_folders = self._organize_resources_by_type(teama_resources)
 
-            # Export Team A artifacts
-            self.logger.info("Saving Team A artifacts...")
-            self.save_artifacts(teama_resources, "teama")
+            # The Team B export runs in its own temp directory, so start it now and
+            # save the Team A artifacts while the export script is running
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.logger.info("Fetching Grafana resources from Team B...")
+                teamb_future = executor.submit(self.fetch_resources_from_teamb)
 
-            self.logger.info("Fetching Grafana resources from Team B...")
-            teamb_resources = self.fetch_resources_from_teamb()
+                # Export Team A artifacts
+                self.logger.info("Saving Team A artifacts...")
+                self.save_artifacts(teama_resources, "teama")
+
+                teamb_resources = teamb_future.result()
 
             # Organize Team B resources
             teamb_dashboards, teamb_folders = self._organize_resources_by_type(teamb_resources)
@@ -716,9 +836,9 @@ exec "{self.export_script}"
             })
 
             # Display results in tabular format
-            self.logger.info(f"=" * 80)
+            self.logger.info(_DIVIDER_EQ)
             self.logger.info(f"🎯 GRAFANA DASHBOARDS DRY RUN RESULTS")
-            self.logger.info(f"=" * 80)
+            self.logger.info(_DIVIDER_EQ)
 
             # Display migration table
             self._display_migration_table(table_data)
@@ -729,13 +849,13 @@ exec "{self.export_script}"
 
             print("")
             print("📊 MIGRATION SUMMARY")
-            print("─" * 40)
-            print(f"{'Total Team A Resources:':<25} {total_teama_resources:>10}")
-            print(f"{'  - Dashboards:':<25} {len(teama_dashboards):>10}")
-            print(f"{'  - Folders:':<25} {len(teama_folders):>10}")
-            print(f"{'Total Team B Resources:':<25} {total_teamb_resources:>10}")
-            print(f"{'  - Dashboards:':<25} {len(teamb_dashboards):>10}")
-            print(f"{'  - Folders:':<25} {len(teamb_folders):>10}")
+            print(_DIVIDER_DASH)
+            print(_SUMMARY_ROW.format(label='Total Team A Resources:', value=total_teama_resources))
+            print(_SUMMARY_ROW.format(label='  - Dashboards:', value=len(teama_dashboards)))
+            print(_SUMMARY_ROW.format(label='  - Folders:', value=len(teama_folders)))
+            print(_SUMMARY_ROW.format(label='Total Team B Resources:', value=total_teamb_resources))
+            print(_SUMMARY_ROW.format(label='  - Dashboards:', value=len(teamb_dashboards)))
+            print(_SUMMARY_ROW.format(label='  - Folders:', value=len(teamb_folders)))
 
             print("")
             print("📋 MIGRATION PROCESS:")
@@ -751,7 +871,7 @@ exec "{self.export_script}"
                 print("⚠️  NOTE: This service uses shell scripts for migration")
                 print("📁 Exported files will be available in the scripts directory")
 
-            self.logger.info(f"=" * 80)
+            self.logger.info(_DIVIDER_EQ)
 
             self.log_migration_complete(self.service_name, True, 0, 0)
             return True
@@ -763,6 +883,13 @@ exec "{self.export_script}"
 
     def migrate(self) -> bool:
         """Perform the actual Grafana dashboards migration using shell scripts."""
+        log = self.logger
+
+        # Non-interactive runs (CI, log shippers) get plain ASCII markers throughout
+        use_emoji = sys.stdout.isatty()
+        status_labels = _EMOJI_STATUS_LABELS if use_emoji else _ASCII_STATUS_LABELS
+        marker = _EMOJI_MARKERS if use_emoji else _ASCII_MARKERS
+
         try:
             self.log_migration_start(self.service_name, dry_run=False)
 
@@ -771,7 +898,7 @@ exec "{self.export_script}"
             overall_success = True
 
             # Step 1: Run import script to fetch from Team A
-            self.logger.info("🔄 Step 1: Exporting dashboards and folders from Team A...")
+            log.info("%s Step 1: Exporting dashboards and folders from Team A...", marker['step'])
             self._add_operation_delay()
 
             import_success, import_stdout, import_stderr = self._run_shell_script(self.import_script, "import")
@@ -783,28 +910,36 @@ exec "{self.export_script}"
                 teama_resources = teama_dashboards + teama_folders
 
                 # Export Team A artifacts
-                self.logger.info("Saving Team A artifacts...")
+                log.info("Saving Team A artifacts...")
                 self.save_artifacts(teama_resources, "teama")
 
-                migration_operations.append({
-                    'operation': 'Export from Team A',
-                    'status': '✅ Success',
-                    'details': f'{len(teama_dashboards)} dashboards, {len(teama_folders)} folders exported'
-                })
+                # Only the count is needed from here on; release the parsed Team A
+                # JSON before the Team B sync and verification run
+                teama_count = len(teama_resources)
+                teama_details = f'{len(teama_dashboards)} dashboards, {len(teama_folders)} folders exported'
+                del teama_resources, teama_dashboards, teama_folders
+
+                migration_operations.append(MigrationOp(
+                    operation='Export from Team A',
+                    status=status_labels[OpStatus.SUCCESS],
+                    details=teama_details,
+                    status_code=OpStatus.SUCCESS
+                ))
             else:
-                migration_operations.append({
-                    'operation': 'Export from Team A',
-                    'status': '❌ Failed',
-                    'details': f'Error: {import_stderr}'
-                })
+                migration_operations.append(MigrationOp(
+                    operation='Export from Team A',
+                    status=status_labels[OpStatus.FAILURE],
+                    details=f'Error: {import_stderr}',
+                    status_code=OpStatus.FAILURE
+                ))
                 overall_success = False
                 # If Team A export fails, we can't proceed
-                self.logger.error("Cannot proceed without Team A data")
+                log.error("Cannot proceed without Team A data")
                 return False
 
             # Step 2: Sync dashboards and folders to Team B (delete, update, create)
-            self.logger.info("🔄 Step 2: Syncing dashboards and folders to Team B...")
-            self.logger.info("   This will ensure Team B matches Team A exactly")
+            log.info("%s Step 2: Syncing dashboards and folders to Team B...", marker['step'])
+            log.info("   This will ensure Team B matches Team A exactly")
             self._add_operation_delay()
 
             import_to_teamb_success, import_to_teamb_stdout, import_to_teamb_stderr = self._run_shell_script(
@@ -815,112 +950,148 @@ exec "{self.export_script}"
                 # Parse sync results from stdout
                 sync_details = self._parse_sync_results(import_to_teamb_stdout)
 
-                migration_operations.append({
-                    'operation': 'Sync to Team B',
-                    'status': '✅ Success',
-                    'details': sync_details
-                })
-                self.logger.info("✅ Successfully synced resources to Team B")
-                self.logger.info(f"Sync results: {sync_details}")
+                migration_operations.append(MigrationOp(
+                    operation='Sync to Team B',
+                    status=status_labels[OpStatus.SUCCESS],
+                    details=sync_details,
+                    status_code=OpStatus.SUCCESS
+                ))
+                log.info("%s Successfully synced resources to Team B", marker['ok'])
+                log.info("Sync results: %s", sync_details)
 
                 # Log detailed output for debugging
                 if import_to_teamb_stdout:
-                    self.logger.debug(f"Sync output: {import_to_teamb_stdout}")
+                    log.debug("Sync output: %s", import_to_teamb_stdout)
             else:
-                migration_operations.append({
-                    'operation': 'Sync to Team B',
-                    'status': '❌ Failed',
-                    'details': f'Error: {import_to_teamb_stderr}'
-                })
+                migration_operations.append(MigrationOp(
+                    operation='Sync to Team B',
+                    status=status_labels[OpStatus.FAILURE],
+                    details=f'Error: {import_to_teamb_stderr}',
+                    status_code=OpStatus.FAILURE
+                ))
                 overall_success = False
-                self.logger.error(f"Failed to sync to Team B: {import_to_teamb_stderr}")
+                log.error("Failed to sync to Team B: %s", import_to_teamb_stderr)
                 if import_to_teamb_stdout:
-                    self.logger.error(f"Sync output: {import_to_teamb_stdout}")
+                    log.error("Sync output: %s", import_to_teamb_stdout)
 
             # Step 3: Verify by exporting from Team B (optional verification)
-            self.logger.info("🔄 Step 3: Verifying import by checking Team B...")
-            self._add_operation_delay()
-
-            # Clean directories before verification export
-            self._clean_script_directories()
-
-            export_success, export_stdout, export_stderr = self._run_shell_script(self.export_script, "export")
-
-            if export_success:
-                # Load and count Team B resources after import
-                teamb_dashboards = self._load_json_files_from_directory(self.dashboards_dir, "dashboard")
-                teamb_folders = self._load_json_files_from_directory(self.folders_dir, "folder")
-                teamb_resources = teamb_dashboards + teamb_folders
-
-                # Export Team B artifacts
-                self.logger.info("Saving Team B artifacts (post-import)...")
-                self.save_artifacts(teamb_resources, "teamb")
-
-                migration_operations.append({
-                    'operation': 'Verify Team B',
-                    'status': '✅ Success',
-                    'details': f'{len(teamb_dashboards)} dashboards, {len(teamb_folders)} folders verified'
-                })
+            # There is nothing useful to verify if the sync itself failed
+            verify_ops = []
+            if import_to_teamb_success:
+                log.info("%s Step 3: Verifying import by checking Team B...", marker['step'])
+                self._add_operation_delay()
+
+                # Clean directories before verification export
+                self._clean_script_directories()
+
+                export_success, export_stdout, export_stderr = self._run_shell_script(self.export_script, "export")
+
+                if export_success:
+                    # Load and count Team B resources after import
+                    teamb_dashboards, teamb_folders = self._load_dashboards_and_folders(
+                        self.dashboards_dir, self.folders_dir
+                    )
+                    verify_details = f'{len(teamb_dashboards)} dashboards, {len(teamb_folders)} folders verified'
+
+                    # The loader hands back fresh lists, so extend in place rather than copying both
+                    teamb_resources = teamb_dashboards
+                    teamb_resources.extend(teamb_folders)
+                    del teamb_dashboards, teamb_folders
+
+                    # Export Team B artifacts
+                    log.info("Saving Team B artifacts (post-import)...")
+                    self.save_artifacts(teamb_resources, "teamb")
+
+                    verify_ops.append(MigrationOp(
+                        operation='Verify Team B',
+                        status=status_labels[OpStatus.SUCCESS],
+                        details=verify_details,
+                        status_code=OpStatus.SUCCESS
+                    ))
+                else:
+                    verify_ops.append(MigrationOp(
+                        operation='Verify Team B',
+                        status=status_labels[OpStatus.WARNING],
+                        details=f'Verification failed: {export_stderr}',
+                        status_code=OpStatus.WARNING
+                    ))
+                    # Don't fail overall migration for verification issues
+                    log.warning("Verification failed but import may have succeeded")
             else:
-                migration_operations.append({
-                    'operation': 'Verify Team B',
-                    'status': '⚠️ Warning',
-                    'details': f'Verification failed: {export_stderr}'
-                })
-                # Don't fail overall migration for verification issues
-                self.logger.warning("Verification failed but import may have succeeded")
+                export_success = False
+                verify_ops.append(MigrationOp(
+                    operation='Verify Team B',
+                    status=status_labels[OpStatus.SKIPPED],
+                    details='Skipped because sync to Team B failed',
+                    status_code=OpStatus.SKIPPED
+                ))
+                log.warning("Skipping Team B verification because sync to Team B failed")
+
+            migration_operations.extend(verify_ops)
 
             # Save failed operations log if any failures occurred
             if self.failed_operations:
-                self._save_failed_operations_log()
+                self._save_failed_operations_log_in_background()
 
             # Display results in tabular format
-            self.logger.info(f"=" * 80)
-            self.logger.info(f"🎉 GRAFANA DASHBOARDS MIGRATION RESULTS")
-            self.logger.info(f"=" * 80)
+            log.info(_DIVIDER_EQ)
+            log.info("%s GRAFANA DASHBOARDS MIGRATION RESULTS", marker['done'])
+            log.info(_DIVIDER_EQ)
 
             # Display migration results table
             self._display_migration_results_table(migration_operations)
 
             # Display overall summary using print for clean formatting
-            successful_operations = sum(1 for op in migration_operations if '✅' in op['status'])
+            successful_operations = sum(1 for op in migration_operations if op.status_code == OpStatus.SUCCESS)
             failed_operations = len(migration_operations) - successful_operations
 
-            print("")
-            print("📊 OVERALL MIGRATION SUMMARY")
-            print("─" * 40)
-            print(f"{'Total Operations:':<25} {len(migration_operations):>10}")
-            print(f"{'Successful Operations:':<25} {successful_operations:>10}")
-            print(f"{'Failed Operations:':<25} {failed_operations:>10}")
+            # Build the summary and write it in one go instead of a print per line
+            summary_lines = [
+                "",
+                "📊 OVERALL MIGRATION SUMMARY" if use_emoji else "[SUMMARY] OVERALL MIGRATION SUMMARY",
+                _DIVIDER_DASH,
+                _SUMMARY_ROW.format(label='Total Operations:', value=len(migration_operations)),
+                _SUMMARY_ROW.format(label='Successful Operations:', value=successful_operations),
+                _SUMMARY_ROW.format(label='Failed Operations:', value=failed_operations),
+            ]
 
             if import_success and export_success:
-                print(f"{'Team A Resources:':<25} {len(teama_resources):>10}")
-                print(f"{'Team B Resources:':<25} {len(teamb_resources):>10}")
+                summary_lines.append(_SUMMARY_ROW.format(label='Team A Resources:', value=teama_count))
+                summary_lines.append(_SUMMARY_ROW.format(label='Team B Resources:', value=len(teamb_resources)))
 
-            print("")
+            summary_lines.append("")
             if overall_success:
-                print("🎉 All operations completed successfully!")
-                print("📁 Exported files are available in the scripts directory:")
-                print(f"   - Dashboards: {self.dashboards_dir}")
-                print(f"   - Folders: {self.folders_dir}")
+                summary_lines.extend([
+                    "🎉 All operations completed successfully!" if use_emoji else "[OK] All operations completed successfully!",
+                    "📁 Exported files are available in the scripts directory:" if use_emoji
+                    else "Exported files are available in the scripts directory:",
+                    f"   - Dashboards: {self.dashboards_dir}",
+                    f"   - Folders: {self.folders_dir}",
+                ])
             else:
-                print("⚠️ Some operations failed - check logs for details")
+                summary_lines.append(
+                    "⚠️ Some operations failed - check logs for details" if use_emoji
+                    else "[WARN] Some operations failed - check logs for details"
+                )
+
+            sys.stdout.write("\n".join(summary_lines) + "\n")
+            sys.stdout.flush()
 
             self.log_migration_complete(self.service_name, overall_success, successful_operations, failed_operations)
 
             if overall_success:
-                self.logger.info("🎉 Grafana dashboards migration completed successfully!")
+                log.info("%s Grafana dashboards migration completed successfully!", marker['done'])
             else:
-                self.logger.warning(f"⚠️ Grafana dashboards migration completed with {failed_operations} failures")
+                log.warning("%s Grafana dashboards migration completed with %d failures", marker['warn'], failed_operations)
 
             return overall_success
 
         except Exception as e:
-            self.logger.error(f"Migration failed: {e}")
+            log.error("Migration failed: %s", e)
 
             # Save failed operations log
             if self.failed_operations:
-                self._save_failed_operations_log()
+                self._save_failed_operations_log_in_background()
 
             self.log_migration_complete(self.service_name, False, 0, 1)
             return False
@@ -7,23 +7,49 @@ It supports:
 - Creating new rule groups in Team B
 - Deleting rule groups from Team B
 - Comparing rule groups to detect changes
+- Two sync strategies: delete & recreate all (default) or diff & sync
 - Dry-run functionality
 - Failed operations logging with exponential backoff
 """
 
-from typing import Dict, List, Any
+import hashlib
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+from core import json_utils
 from core.base_service import BaseService
 from core.config import Config
 from core.api_client import CoralogixAPIError
+from core.rate_limiter import TokenBucket
 from core.safety_manager import SafetyManager, SafetyCheckResult
 from core.version_manager import VersionManager
 
 
+_ORDER_KEY = itemgetter('order')
+
+
 class ParsingRulesService(BaseService):
     """Service for migrating parsing rule groups between teams."""
 
+    # Sync strategies: delete every Team B rule group and recreate Team A's, or only touch the differences
+    SYNC_MODES = ('recreate_all', 'diff_sync')
+
+    # System-generated fields that don't take part in rule group comparison, stripped from
+    # rule groups, their subgroups and their rules alike
+    _COMPARE_IGNORE_FIELDS = frozenset({'id', 'teamId'})
+
+    # Read-only, system-generated fields that must not be sent in a create request
+    _CREATE_EXCLUDE_FIELDS = frozenset({'id', 'teamId'})
+
     def __init__(self, config: Config, logger):
         super().__init__(config, logger)
         self._setup_failed_rules_logging()
@@ -32,6 +58,29 @@ class ParsingRulesService(BaseService):
         self.safety_manager = SafetyManager(config, self.service_name)
         self.version_manager = VersionManager(config, self.service_name)
 
+        # Bounded concurrency for deletions, paced by a token bucket instead of fixed sleeps
+        self.max_concurrent_operations = max(1, config.parsing_rules_parallelism)
+        self._rate_limiter = TokenBucket(rate=config.api_rate_limit_per_second, capacity=20)
+
+        self._mode = config.parsing_rules_mode
+        if self._mode not in self.SYNC_MODES:
+            raise ValueError(f"Invalid parsing rules mode: {self._mode}. Must be one of {', '.join(self.SYNC_MODES)}")
+
+        # Extra AIMD pacing on top of the token bucket: zero while the API is healthy,
+        # grows when it answers with 429/5xx and decays again on success
+        self._inter_request_delay = 0.0
+        self._pacing_lock = threading.Lock()
+
+        # The configured rate is the ceiling; 429s halve the bucket rate and successes ramp it back
+        self._max_request_rate = float(config.api_rate_limit_per_second)
+
+        # Per-run caches of create payloads and fingerprints, keyed by rule group id
+        self._prepared_cache: Dict[str, Dict[str, Any]] = {}
+        self._hash_cache: Dict[str, str] = {}
+
+        # Mixed into every Idempotency-Key so keys are never reused across runs
+        self._run_id = uuid.uuid4().hex
+
     @property
     def service_name(self) -> str:
         return "parsing-rules"
@@ -41,31 +90,53 @@ class ParsingRulesService(BaseService):
         return "/api/v1/rulegroups"
     
     def _setup_failed_rules_logging(self):
-        """Setup logging directory for failed parsing rules."""
+        """Setup logging directory and per-run log file for failed parsing rules."""
         self.failed_rules_dir = Path("logs/parsing_rules")
         self.failed_rules_dir.mkdir(parents=True, exist_ok=True)
 
+        # One append-only JSON Lines file per run, opened on the first failure
+        self._run_started_at = datetime.now()
+        self.failed_log_file = self.failed_rules_dir / f"failed_parsing_rules_{self._run_started_at:%Y%m%d_%H%M%S}.jsonl"
+        self._failed_log_fh = None
+        self._failed_log_lock = threading.Lock()
+
+    def _close_failed_rules_log(self):
+        """Close the failed rule groups log file if it was opened."""
+        with self._failed_log_lock:
+            if self._failed_log_fh is not None:
+                self._failed_log_fh.close()
+                self._failed_log_fh = None
+
+    def _fetch_rule_groups(self, client, team_label: str) -> List[Dict[str, Any]]:
+        """
+        Fetch all parsing rule groups through the given team's API client.
+
+        Errors are left to the callers, which handle them differently per team.
+        """
+        self.logger.info("Fetching parsing rule groups from %s", team_label)
+
+        # Make direct API call to get rule groups
+        response = client.get(self.api_endpoint)
+
+        # Extract rule groups from response
+        rule_groups = response.get('ruleGroups', [])
+
+        self.logger.info("Fetched %s parsing rule groups from %s", len(rule_groups), team_label)
+        return rule_groups
+
     def fetch_resources_from_teama(self) -> List[Dict[str, Any]]:
         """Fetch all parsing rule groups from Team A with safety checks."""
         api_error = None
         rule_groups = []
 
         try:
-            self.logger.info("Fetching parsing rule groups from Team A")
-
-            # Make direct API call to get rule groups
-            response = self.teama_client.get(self.api_endpoint)
-
-            # Extract rule groups from response
-            rule_groups = response.get('ruleGroups', [])
-
-            self.logger.info(f"Fetched {len(rule_groups)} parsing rule groups from Team A")
+            rule_groups = self._fetch_rule_groups(self.teama_client, "Team A")
 
         except CoralogixAPIError as e:
-            self.logger.error(f"Failed to fetch parsing rule groups from Team A: {e}")
+            self.logger.error("Failed to fetch parsing rule groups from Team A: %s", e)
             api_error = e
         except Exception as e:
-            self.logger.error(f"Unexpected error fetching parsing rule groups from Team A: {e}")
+            self.logger.error("Unexpected error fetching parsing rule groups from Team A: %s", e)
             api_error = e
 
         # Get previous count for safety check
@@ -78,8 +149,8 @@ class ParsingRulesService(BaseService):
         )
 
         if not safety_result.is_safe:
-            self.logger.error(f"TeamA fetch safety check failed: {safety_result.reason}")
-            self.logger.error(f"Safety check details: {safety_result.details}")
+            self.logger.error("TeamA fetch safety check failed: %s", safety_result.reason)
+            self.logger.error("Safety check details: %s", safety_result.details)
 
             # If we have an API error, raise it
             if api_error:
@@ -97,51 +168,68 @@ class ParsingRulesService(BaseService):
     def fetch_resources_from_teamb(self) -> List[Dict[str, Any]]:
         """Fetch all parsing rule groups from Team B."""
         try:
-            self.logger.info("Fetching parsing rule groups from Team B")
-
-            # Make direct API call to get rule groups
-            response = self.teamb_client.get(self.api_endpoint)
-
-            # Extract rule groups from response
-            rule_groups = response.get('ruleGroups', [])
-
-            self.logger.info(f"Fetched {len(rule_groups)} parsing rule groups from Team B")
-            return rule_groups
+            return self._fetch_rule_groups(self.teamb_client, "Team B")
 
         except CoralogixAPIError as e:
             # Handle 500 gracefully when Team B has no parsing rules
             if "500" in str(e):
                 self.logger.info("No parsing rule groups found in Team B (500 response - empty collection)")
                 return []
-            self.logger.error(f"Failed to fetch parsing rule groups from Team B: {e}")
+            self.logger.error("Failed to fetch parsing rule groups from Team B: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error fetching parsing rule groups from Team B: {e}")
+            self.logger.error("Unexpected error fetching parsing rule groups from Team B: %s", e)
             raise
     
+    def _fetch_resources_from_both_teams(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch rule groups from Team A and Team B concurrently.
+
+        The two fetches hit different API clients and don't depend on each other,
+        so the setup phase takes as long as the slower one instead of both combined.
+
+        Returns:
+            Tuple of (teama_resources, teamb_resources)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.logger.info("Fetching parsing rule groups from Team A...")
+            teama_future = executor.submit(self.fetch_resources_from_teama)  # This includes safety checks
+
+            self.logger.info("Fetching parsing rule groups from Team B...")
+            teamb_future = executor.submit(self.fetch_resources_from_teamb)
+
+            # Team A is resolved first so its safety check failures take precedence
+            return teama_future.result(), teamb_future.result()
+
     def create_resource_in_teamb(self, resource: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a parsing rule group in Team B with exponential backoff and delay."""
+        """Create a parsing rule group in Team B with exponential backoff and rate limiting."""
         try:
             # Remove fields that shouldn't be included in creation
             create_data = self._prepare_resource_for_creation(resource)
             rule_group_name = create_data.get('name', 'Unknown')
 
-            # Validate that the rule group has at least one subgroup with rules
+            # Validate that the rule group has at least one subgroup with rules. migrate filters
+            # these out before creating, so this is only a guard for other callers.
             rule_subgroups = create_data.get('ruleSubgroups', [])
             if not rule_subgroups or len(rule_subgroups) == 0:
-                self.logger.warning(f"⚠️  Skipping rule group '{rule_group_name}' - no ruleSubgroups found (API requires at least 1 rule)")
+                self.logger.warning("⚠️  Skipping rule group '%s' - no ruleSubgroups found (API requires at least 1 rule)", rule_group_name)
                 return {'skipped': True, 'reason': 'no_rules', 'name': rule_group_name}
 
-            self.logger.info(f"Creating parsing rule group in Team B: {rule_group_name}")
+            self.logger.info("Creating parsing rule group in Team B: %s", rule_group_name)
 
-            # Add delay before creation to avoid overwhelming the API
+            # Wait for the rate limiter before creation to avoid overwhelming the API
             self._add_creation_delay()
 
-            # Create the rule group with exponential backoff
+            # The key is stable across retries of this create, so a retry after an ambiguous
+            # failure (e.g. a timeout after the server committed) can be deduplicated, but it
+            # differs between runs and between rule groups with identical content
+            idempotency_headers = {'Idempotency-Key': self._idempotency_key(resource, create_data)}
+
+            # Create the rule group with backoff; the idempotency key makes a short first wait safe
             def _create_operation():
-                return self.teamb_client.post(self.api_endpoint, json_data=create_data)
+                return self.teamb_client.post(self.api_endpoint, json_data=create_data, headers=idempotency_headers)
 
-            response = self._retry_with_exponential_backoff(_create_operation)
+            response = self._retry_with_backoff(_create_operation, base_wait=0.1)
 
             self.log_resource_action("create", "parsing_rule_group", rule_group_name, True)
 
@@ -157,7 +245,7 @@ class ParsingRulesService(BaseService):
     def delete_resource_from_teamb(self, resource_id: str) -> bool:
         """Delete a parsing rule group from Team B."""
         try:
-            self.logger.info(f"Deleting parsing rule group from Team B: {resource_id}")
+            self.logger.info("Deleting parsing rule group from Team B: %s", resource_id)
 
             # Delete the rule group
             self.teamb_client.delete(f"{self.api_endpoint}/{resource_id}")
@@ -169,35 +257,97 @@ class ParsingRulesService(BaseService):
             self.log_resource_action("delete", "parsing_rule_group", resource_id, False, str(e))
             raise
     
+    def _idempotency_key(self, resource: Dict[str, Any], create_data: Dict[str, Any]) -> str:
+        """Derive an Idempotency-Key from the run id, the source rule group id and the create payload."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._run_id.encode())
+        digest.update(str(resource.get('id')).encode())
+        digest.update(json_utils.dumps(create_data, sort_keys=True))
+        return digest.hexdigest()
+
     def _add_creation_delay(self):
-        """Add a small delay before creation to avoid overwhelming the API."""
-        import time
-        delay_seconds = 0.5  # 500ms delay between creations
-        time.sleep(delay_seconds)
+        """Wait for a token from the rate limiter, plus any adaptive delay, before a mutating API call."""
+        self._rate_limiter.acquire()
 
-    def _retry_with_exponential_backoff(self, operation, max_retries: int = 3):
-        """Retry an operation with exponential backoff."""
-        import time
+        delay = self._inter_request_delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def _record_api_outcome(self, error: Optional[Exception] = None):
+        """
+        Adapt pacing to the API's responses.
+
+        A 429 halves the token bucket rate and drains it; a 429 or 5xx also grows the
+        extra per-request delay. Each success decays the delay and ramps the rate back
+        up towards the configured limit.
+        """
+        status_code = getattr(error, 'status_code', None)
+        with self._pacing_lock:
+            if error is None:
+                self._inter_request_delay *= 0.9
+                if self._inter_request_delay < 0.01:
+                    self._inter_request_delay = 0.0
+                if self._rate_limiter.rate < self._max_request_rate:
+                    self._rate_limiter.set_rate(min(self._max_request_rate, self._rate_limiter.rate * 1.1))
+            elif status_code is not None and (status_code == 429 or status_code >= 500):
+                self._inter_request_delay = min(5.0, max(0.1, self._inter_request_delay * 2 + 0.1))
+                if status_code == 429:
+                    self._rate_limiter.set_rate(max(0.5, self._rate_limiter.rate * 0.5), drain=True)
+
+    @staticmethod
+    def _is_retriable_error(error: Exception) -> bool:
+        """Client errors other than 429 won't succeed on retry, so fail fast on them."""
+        if isinstance(error, CoralogixAPIError) and error.status_code is not None:
+            return not (400 <= error.status_code < 500) or error.status_code == 429
+        return True
+
+    def _retry_with_backoff(self, operation, max_retries: int = 3, is_retriable=None,
+                            base_wait: float = 0.5, max_wait: float = 30.0):
+        """
+        Retry an operation with decorrelated-jitter exponential backoff.
+
+        Each wait is drawn from [base_wait, previous_wait * 3] and capped at max_wait,
+        so concurrent workers don't retry in lockstep. A Retry-After value sent by
+        the API takes precedence over the computed wait.
+
+        Args:
+            operation: Callable to run
+            max_retries: Maximum number of attempts
+            is_retriable: Predicate deciding whether an error is worth retrying
+            base_wait: Minimum wait between attempts in seconds
+            max_wait: Maximum wait between attempts in seconds
+
+        Returns:
+            The operation's return value
+        """
+        is_retriable = is_retriable or self._is_retriable_error
+        wait_time = base_wait
 
         for attempt in range(max_retries):
             try:
-                return operation()
+                result = operation()
+                self._record_api_outcome()
+                return result
             except Exception as e:
-                if attempt == max_retries - 1:
+                self._record_api_outcome(e)
+                if attempt == max_retries - 1 or not is_retriable(e):
                     raise
 
-                wait_time = (2 ** attempt) * 1  # 1s, 2s, 4s
-                self.logger.warning(f"Operation failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}")
-                time.sleep(wait_time)
+                retry_after = getattr(e, 'retry_after', None)
+                if retry_after is not None:
+                    wait_time = min(max_wait, retry_after)
+                else:
+                    wait_time = min(max_wait, random.uniform(base_wait, wait_time * 3))
 
-    def _log_failed_rule_group(self, rule_group: Dict[str, Any], operation: str, error: str):
-        """Log failed rule group operations to a separate file."""
-        import json
-        from datetime import datetime
+                self.logger.warning("Operation failed (attempt %s/%s), retrying in %.2fs: %s", attempt + 1, max_retries, wait_time, e)
+                time.sleep(wait_time)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        failed_log_file = self.failed_rules_dir / f"failed_parsing_rules_{timestamp}.json"
+    def _retry_with_exponential_backoff(self, operation, max_retries: int = 3):
+        """Retry an operation with exponential backoff."""
+        return self._retry_with_backoff(operation, max_retries)
 
+    def _log_failed_rule_group(self, rule_group: Dict[str, Any], operation: str, error: str):
+        """Append a failed rule group operation to the run's JSON Lines log file."""
         failed_entry = {
             "timestamp": datetime.now().isoformat(),
             "rule_group_id": rule_group.get('id', 'Unknown'),
@@ -207,49 +357,59 @@ class ParsingRulesService(BaseService):
             "rule_group_data": rule_group
         }
 
-        # Load existing failed entries or create new list
-        failed_entries = []
-        if failed_log_file.exists():
-            try:
-                with open(failed_log_file, 'r') as f:
-                    existing_data = json.load(f)
-                    failed_entries = existing_data.get('failed_rule_groups', [])
-            except Exception:
-                pass
-
-        failed_entries.append(failed_entry)
-
-        # Save updated failed entries
-        failed_data = {
-            "timestamp": datetime.now().isoformat(),
-            "total_failed": len(failed_entries),
-            "failed_rule_groups": failed_entries
-        }
-
         try:
-            with open(failed_log_file, 'w') as f:
-                json.dump(failed_data, f, indent=2)
+            line = json_utils.dumps(failed_entry) + b"\n"
+            with self._failed_log_lock:
+                if self._failed_log_fh is None:
+                    self._failed_log_fh = open(self.failed_log_file, 'ab', buffering=0)
+                self._failed_log_fh.write(line)
         except Exception as e:
-            self.logger.error(f"Failed to write failed rule groups log: {e}")
+            self.logger.error("Failed to write failed rule groups log: %s", e)
 
     def _prepare_resource_for_creation(self, resource: Dict[str, Any]) -> Dict[str, Any]:
         """
         Prepare a parsing rule group resource for creation by removing fields that
         shouldn't be included in the create request.
         """
-        # Fields to exclude from creation (read-only or system-generated)
-        exclude_fields = {
-            'id', 'teamId'  # These are system-generated
-        }
+        resource_id = resource.get('id')
+        if resource_id is not None and resource_id in self._prepared_cache:
+            return self._prepared_cache[resource_id]
 
         # Create a copy without excluded fields (only at top level)
         create_data = {
             k: v for k, v in resource.items()
-            if k not in exclude_fields and v is not None
+            if k not in self._CREATE_EXCLUDE_FIELDS and v is not None
         }
 
+        if resource_id is not None:
+            self._prepared_cache[resource_id] = create_data
+
         return create_data
 
+    def _clear_resource_caches(self):
+        """Drop cached prepared rule groups and fingerprints and start a new run id so a new run starts fresh."""
+        self._prepared_cache.clear()
+        self._hash_cache.clear()
+        self._run_id = uuid.uuid4().hex
+
+    @staticmethod
+    def _sorted_by_order(resources: List[Dict[str, Any]], reverse: bool = False) -> List[Dict[str, Any]]:
+        """
+        Return rule groups sorted by their top-level order, treating a missing order as 0.
+
+        Rule groups returned by the API normally carry an order, so the C-level itemgetter
+        key is tried first; the .get() fallback only runs if one is missing.
+        """
+        try:
+            return sorted(resources, key=_ORDER_KEY, reverse=reverse)
+        except KeyError:
+            return sorted(resources, key=lambda r: r.get('order', 0), reverse=reverse)
+
+    @staticmethod
+    def _creation_order_key(resource: Dict[str, Any]) -> Tuple[Any, str]:
+        """Sort key for creating rule groups: by order (missing orders last), then by name for consistency."""
+        return resource.get('order', 999999), resource.get('name', '')
+
     def _sort_resources_by_order(self, resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Sort resources by their order property to ensure correct creation sequence.
@@ -260,35 +420,20 @@ class ParsingRulesService(BaseService):
         Returns:
             Sorted list of resources
         """
-        def get_sort_key(resource):
-            # Primary sort by rule group order
-            group_order = resource.get('order', 999999)  # Default to high number if no order
-
-            # Secondary sort by name for consistency
-            name = resource.get('name', '')
+        sorted_resources = sorted(resources, key=self._creation_order_key)
 
-            return (group_order, name)
-
-        sorted_resources = sorted(resources, key=get_sort_key)
-
-        # Also sort rules within each rule group
+        # Also sort rules within each rule group, in place since the lists are already owned by the resource
         for resource in sorted_resources:
             rule_subgroups = resource.get('ruleSubgroups', [])
             if rule_subgroups:
                 # Sort subgroups by order
-                resource['ruleSubgroups'] = sorted(
-                    rule_subgroups,
-                    key=lambda sg: (sg.get('order', 999999), sg.get('id', ''))
-                )
+                rule_subgroups.sort(key=lambda sg: (sg.get('order', 999999), sg.get('id', '')))
 
                 # Sort rules within each subgroup
-                for subgroup in resource['ruleSubgroups']:
+                for subgroup in rule_subgroups:
                     rules = subgroup.get('rules', [])
                     if rules:
-                        subgroup['rules'] = sorted(
-                            rules,
-                            key=lambda r: (r.get('order', 999999), r.get('name', ''))
-                        )
+                        rules.sort(key=lambda r: (r.get('order', 999999), r.get('name', '')))
 
         return sorted_resources
 
@@ -304,20 +449,11 @@ class ParsingRulesService(BaseService):
         Returns:
             True if deletion succeeded, False otherwise
         """
-        for attempt in range(max_retries):
-            try:
-                if self.delete_resource_from_teamb(resource_id):
-                    return True
-                else:
-                    self.logger.warning(f"Deletion attempt {attempt + 1} failed for {resource_name}")
-            except Exception as e:
-                self.logger.warning(f"Deletion attempt {attempt + 1} failed for {resource_name}: {e}")
-
-            if attempt < max_retries - 1:
-                import time
-                time.sleep(1)  # Wait 1 second before retry
-
-        return False
+        try:
+            return self._retry_with_backoff(lambda: self.delete_resource_from_teamb(resource_id), max_retries)
+        except Exception as e:
+            self.logger.warning("Deletion failed for %s: %s", resource_name, e)
+            return False
 
     def _verify_basic_safety(self):
         """
@@ -339,21 +475,56 @@ class ParsingRulesService(BaseService):
         """
         Compare two parsing rule groups to see if they are equal.
         """
-        # Fields to ignore in comparison (system-generated or metadata)
-        ignore_fields = {
-            'id', 'teamId'  # System-generated fields
-        }
+        # Different fingerprints mean different rule groups; only matching ones need a deep compare
+        if self._canonical_hash(resource_a) != self._canonical_hash(resource_b):
+            return False
 
-        def normalize_resource(resource):
-            return {
-                k: v for k, v in resource.items()
-                if k not in ignore_fields
-            }
+        return self._normalize_resource(resource_a) == self._normalize_resource(resource_b)
+
+    def _canonical_hash(self, resource: Dict[str, Any]) -> str:
+        """Return a stable fingerprint of a rule group's comparable fields, cached by id."""
+        resource_id = resource.get('id')
+        if resource_id is not None and resource_id in self._hash_cache:
+            return self._hash_cache[resource_id]
+
+        canonical = json_utils.dumps(self._normalize_resource(resource), sort_keys=True)
+        digest = hashlib.blake2b(canonical, digest_size=8).hexdigest()
 
-        normalized_a = normalize_resource(resource_a)
-        normalized_b = normalize_resource(resource_b)
+        if resource_id is not None:
+            self._hash_cache[resource_id] = digest
 
-        return normalized_a == normalized_b
+        return digest
+
+    def _normalize_resource(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return a rule group without its system-generated fields, for comparison.
+
+        Subgroup and rule ids are server-generated too and never match across teams, so they
+        are stripped at every level. The top-level order is left out as well: diff & sync
+        reconciles rule group positions separately.
+        """
+        ignore_fields = self._COMPARE_IGNORE_FIELDS
+
+        def strip(item):
+            # Non-dict entries are compared as-is
+            if not isinstance(item, dict):
+                return item
+            return {k: v for k, v in item.items() if k not in ignore_fields}
+
+        normalized = strip(resource)
+        normalized.pop('order', None)
+
+        subgroups = normalized.get('ruleSubgroups')
+        if isinstance(subgroups, list):
+            normalized_subgroups = []
+            for subgroup in subgroups:
+                normalized_subgroup = strip(subgroup)
+                if isinstance(normalized_subgroup, dict) and isinstance(normalized_subgroup.get('rules'), list):
+                    normalized_subgroup['rules'] = [strip(rule) for rule in normalized_subgroup['rules']]
+                normalized_subgroups.append(normalized_subgroup)
+            normalized['ruleSubgroups'] = normalized_subgroups
+
+        return normalized
     
     def migrate(self) -> bool:
         """
@@ -365,35 +536,41 @@ class ParsingRulesService(BaseService):
 
         This is the same approach as custom-actions and guarantees order consistency.
 
+        With PARSING_RULES_MODE=diff_sync only the rule groups that differ are touched instead.
+
         Returns:
             True if migration completed successfully
         """
+        if self._mode == 'diff_sync':
+            return self._migrate_diff_sync()
+
+        artifact_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="parsing-rules-artifacts")
+        final_artifact_future = None
+
         try:
             self.log_migration_start(self.service_name, dry_run=False)
+            self._clear_resource_caches()
 
             # Step 0: Basic safety verification
             self._verify_basic_safety()
 
             # Step 1: Fetch resources from both teams
-            self.logger.info("Fetching parsing rule groups from Team A...")
-            teama_resources = self.fetch_resources_from_teama()  # This includes safety checks
+            teama_resources, teamb_resources = self._fetch_resources_from_both_teams()
+            teamb_count = len(teamb_resources)
 
-            self.logger.info("Fetching parsing rule groups from Team B...")
-            teamb_resources = self.fetch_resources_from_teamb()
+            # Step 2: Export artifacts in the background while the snapshot and safety checks run
+            self.logger.info("Saving Team A and Team B artifacts...")
+            artifact_futures = [
+                artifact_writer.submit(self.save_artifacts, teama_resources, "teama"),
+                artifact_writer.submit(self.save_artifacts, teamb_resources, "teamb"),
+            ]
 
-            # Step 2: Create pre-migration version snapshot
+            # Step 3: Create pre-migration version snapshot
             self.logger.info("Creating pre-migration version snapshot...")
             pre_migration_version = self.version_manager.create_version_snapshot(
                 teama_resources, teamb_resources, 'pre_migration'
             )
-            self.logger.info(f"Pre-migration snapshot created: {pre_migration_version}")
-
-            # Step 3: Export artifacts
-            self.logger.info("Saving Team A artifacts...")
-            self.save_artifacts(teama_resources, "teama")
-
-            self.logger.info("Saving Team B artifacts...")
-            self.save_artifacts(teamb_resources, "teamb")
+            self.logger.info("Pre-migration snapshot created: %s", pre_migration_version)
 
             # Step 4: Perform mass deletion safety check
             # Get previous TeamA count for trend analysis
@@ -406,10 +583,14 @@ class ParsingRulesService(BaseService):
             )
 
             if not mass_deletion_check.is_safe:
-                self.logger.error(f"Mass deletion safety check failed: {mass_deletion_check.reason}")
-                self.logger.error(f"Safety check details: {mass_deletion_check.details}")
+                self.logger.error("Mass deletion safety check failed: %s", mass_deletion_check.reason)
+                self.logger.error("Safety check details: %s", mass_deletion_check.details)
                 raise RuntimeError(f"Mass deletion safety check failed: {mass_deletion_check.reason}")
 
+            # The artifacts are a backup of Team B, so they must be on disk before anything is deleted
+            for artifact_future in artifact_futures:
+                artifact_future.result()
+
             self.logger.info(
                 "Migration plan - Delete & Recreate All",
                 total_teama_resources=len(teama_resources),
@@ -427,44 +608,58 @@ class ParsingRulesService(BaseService):
             self.logger.info("🗑️ Deleting ALL existing parsing rule groups from Team B...")
 
             if teamb_resources:
-                # Sort by reverse order for safe deletion (higher order numbers first)
-                teamb_resources_sorted = sorted(
-                    teamb_resources,
-                    key=lambda r: r.get('order', 0),
-                    reverse=True
-                )
-
-                for teamb_resource in teamb_resources_sorted:
-                    try:
-                        resource_id = self.get_resource_identifier(teamb_resource)
+                # Deletions are independent of each other, so run them on a bounded pool;
+                # they complete in no particular order
+                def _delete_one(teamb_resource):
+                    resource_id = self.get_resource_identifier(teamb_resource)
+                    resource_name = teamb_resource.get('name', 'Unknown')
+                    self._add_creation_delay()
+                    return bool(resource_id) and self._delete_resource_with_retry(resource_id, resource_name)
+
+                with ThreadPoolExecutor(max_workers=self.max_concurrent_operations) as executor:
+                    futures = {
+                        executor.submit(_delete_one, teamb_resource): teamb_resource
+                        for teamb_resource in teamb_resources
+                    }
+
+                    for future in as_completed(futures):
+                        teamb_resource = futures[future]
                         resource_name = teamb_resource.get('name', 'Unknown')
                         resource_order = teamb_resource.get('order', 'N/A')
 
-                        if resource_id and self._delete_resource_with_retry(resource_id, resource_name):
-                            self.logger.info(f"Deleted rule group: {resource_name} (order: {resource_order})")
-                            delete_count += 1
-                        else:
-                            self.logger.error(f"Failed to delete rule group: {resource_name} after retries")
-                            error_count += 1
+                        try:
+                            if future.result():
+                                self.logger.info("Deleted rule group: %s (order: %s)", resource_name, resource_order)
+                                delete_count += 1
+                            else:
+                                self.logger.error("Failed to delete rule group: %s after retries", resource_name)
+                                error_count += 1
 
-                    except Exception as e:
-                        self.logger.error(f"Failed to delete rule group {teamb_resource.get('name', 'Unknown')}: {e}")
-                        error_count += 1
-
-                # Step 5.1: Verify deletion completed - fetch fresh TeamB state
-                self.logger.info("🔍 Verifying all rule groups were deleted from Team B...")
-                verification_teamb_resources = self.fetch_resources_from_teamb()
+                        except Exception as e:
+                            self.logger.error("Failed to delete rule group %s: %s", resource_name, e)
+                            error_count += 1
 
-                if verification_teamb_resources:
-                    self.logger.error(f"❌ Deletion verification failed: {len(verification_teamb_resources)} rule groups still exist in Team B")
-                    for remaining in verification_teamb_resources:
-                        self.logger.error(f"   Remaining: {remaining.get('name', 'Unknown')} (ID: {remaining.get('id', 'N/A')})")
-                    raise RuntimeError(f"Failed to delete all rule groups from Team B. {len(verification_teamb_resources)} still remain.")
+                # Step 5.1: Every delete returned success, so the responses already confirm
+                # Team B is empty. Only re-fetch to verify when some deletes failed.
+                if delete_count == teamb_count:
+                    self.logger.info("✅ Deletion confirmed by API responses: %s rule groups deleted from Team B", delete_count)
                 else:
-                    self.logger.info("✅ Deletion verification passed: Team B is now empty")
+                    self.logger.info("🔍 Verifying all rule groups were deleted from Team B...")
+                    verification_teamb_resources = self.fetch_resources_from_teamb()
+
+                    if verification_teamb_resources:
+                        self.logger.error("❌ Deletion verification failed: %s rule groups still exist in Team B", len(verification_teamb_resources))
+                        for remaining in verification_teamb_resources:
+                            self.logger.error("   Remaining: %s (ID: %s)", remaining.get('name', 'Unknown'), remaining.get('id', 'N/A'))
+                        raise RuntimeError(f"Failed to delete all rule groups from Team B. {len(verification_teamb_resources)} still remain.")
+                    else:
+                        self.logger.info("✅ Deletion verification passed: Team B is now empty")
             else:
                 self.logger.info("ℹ️ Team B already has no rule groups - skipping deletion")
 
+            # Only the count is needed from here on; release the Team B rule groups before the create phase
+            teamb_resources = futures = None
+
             # Step 6: Create ALL rule groups from Team A (in proper order)
             self.logger.info("📄 Creating ALL parsing rule groups from Team A...")
 
@@ -474,23 +669,35 @@ class ParsingRulesService(BaseService):
                 # Sort resources by order for creation (lower order numbers first)
                 teama_resources_sorted = self._sort_resources_by_order(teama_resources)
 
-                for teama_resource in teama_resources_sorted:
+                # The API rejects rule groups without subgroups, so set those aside up front
+                # and keep the create loop to groups that will actually be sent
+                valid_resources, empty_resources = [], []
+                for resource in teama_resources_sorted:
+                    (valid_resources if resource.get('ruleSubgroups') else empty_resources).append(resource)
+
+                if empty_resources:
+                    skipped_count += len(empty_resources)
+                    self.logger.info("⚠️  Skipping %s rule group(s) with no ruleSubgroups (API requires at least 1 rule)", len(empty_resources))
+                    for resource in empty_resources:
+                        self.logger.info("⚠️  Skipped rule group '%s' - no_rules", resource.get('name', 'Unknown'))
+
+                for teama_resource in valid_resources:
                     try:
                         resource_name = teama_resource.get('name', 'Unknown')
                         resource_order = teama_resource.get('order', 'N/A')
 
-                        self.logger.info(f"Creating rule group: {resource_name} (order: {resource_order})")
+                        self.logger.info("Creating rule group: %s (order: %s)", resource_name, resource_order)
                         result = self.create_resource_in_teamb(teama_resource)
 
                         # Check if the rule group was skipped
                         if isinstance(result, dict) and result.get('skipped'):
                             skipped_count += 1
-                            self.logger.info(f"⚠️  Skipped rule group '{resource_name}' - {result.get('reason')}")
+                            self.logger.info("⚠️  Skipped rule group '%s' - %s", resource_name, result.get('reason'))
                         else:
                             create_success_count += 1
 
                     except Exception as e:
-                        self.logger.error(f"Failed to create rule group {teama_resource.get('name', 'Unknown')}: {e}")
+                        self.logger.error("Failed to create rule group %s: %s", teama_resource.get('name', 'Unknown'), e)
                         error_count += 1
 
                 # Step 6.1: Verify creation completed - fetch final TeamB state
@@ -501,14 +708,14 @@ class ParsingRulesService(BaseService):
                 actual_count = len(final_teamb_resources)
 
                 if actual_count != expected_count:
-                    self.logger.error(f"❌ Creation verification failed: Expected {expected_count} rule groups (skipped {skipped_count}), but found {actual_count} in Team B")
+                    self.logger.error("❌ Creation verification failed: Expected %s rule groups (skipped %s), but found %s in Team B", expected_count, skipped_count, actual_count)
                     raise RuntimeError(f"Creation verification failed: Expected {expected_count} rule groups, but found {actual_count}")
                 else:
-                    self.logger.info(f"✅ Creation verification passed: {actual_count} rule groups successfully created in Team B (skipped {skipped_count} empty rule groups)")
+                    self.logger.info("✅ Creation verification passed: %s rule groups successfully created in Team B (skipped %s empty rule groups)", actual_count, skipped_count)
 
-                    # Save final state to outputs
+                    # Save final state to outputs, overlapping with the post-migration snapshot
                     self.logger.info("💾 Saving final Team B state to outputs...")
-                    self.save_artifacts(final_teamb_resources, "teamb_final")
+                    final_artifact_future = artifact_writer.submit(self.save_artifacts, final_teamb_resources, "teamb_final")
             else:
                 self.logger.info("ℹ️ Team A has no rule groups - skipping creation")
                 final_teamb_resources = []
@@ -520,9 +727,12 @@ class ParsingRulesService(BaseService):
                 post_migration_version = self.version_manager.create_version_snapshot(
                     teama_resources, final_teamb_resources, 'post_migration'
                 )
-                self.logger.info(f"Post-migration snapshot created: {post_migration_version}")
+                self.logger.info("Post-migration snapshot created: %s", post_migration_version)
             except Exception as e:
-                self.logger.warning(f"Failed to create post-migration snapshot: {e}")
+                self.logger.warning("Failed to create post-migration snapshot: %s", e)
+
+            if final_artifact_future is not None:
+                final_artifact_future.result()
 
             # Log completion
             migration_success = error_count == 0
@@ -538,7 +748,7 @@ class ParsingRulesService(BaseService):
             print("MIGRATION RESULTS - PARSING RULE GROUPS")
             print("=" * 60)
             print(f"📊 Team A rule groups: {len(teama_resources)}")
-            print(f"📊 Team B rule groups (before): {len(teamb_resources)}")
+            print(f"📊 Team B rule groups (before): {teamb_count}")
             print(f"📊 Team B rule groups (after): {len(final_teamb_resources)}")
             print(f"🗑️  Deleted from Team B: {delete_count}")
             print(f"✅ Successfully created: {create_success_count}")
@@ -561,9 +771,12 @@ class ParsingRulesService(BaseService):
             return migration_success
 
         except Exception as e:
-            self.logger.error(f"Migration failed: {e}")
+            self.logger.error("Migration failed: %s", e)
             self.log_migration_complete(self.service_name, False, 0, 1)
             return False
+        finally:
+            artifact_writer.shutdown(wait=True)
+            self._close_failed_rules_log()
 
     def rollback_to_version(self, version_id: str) -> bool:
         """
@@ -576,43 +789,40 @@ class ParsingRulesService(BaseService):
             True if rollback completed successfully
         """
         try:
-            self.logger.info(f"Starting rollback to version: {version_id}")
+            self.logger.info("Starting rollback to version: %s", version_id)
+            self._clear_resource_caches()
 
             # Get rollback plan
             rollback_plan = self.version_manager.create_rollback_plan(version_id)
             if not rollback_plan:
-                self.logger.error(f"Failed to create rollback plan for version: {version_id}")
+                self.logger.error("Failed to create rollback plan for version: %s", version_id)
                 return False
 
-            self.logger.info(f"Rollback plan: {rollback_plan['summary']}")
+            self.logger.info("Rollback plan: %s", rollback_plan['summary'])
 
             # Create pre-rollback snapshot
             current_teamb_resources = self.fetch_resources_from_teamb()
             pre_rollback_version = self.version_manager.create_version_snapshot(
                 [], current_teamb_resources, 'pre_rollback'
             )
-            self.logger.info(f"Pre-rollback snapshot created: {pre_rollback_version}")
+            self.logger.info("Pre-rollback snapshot created: %s", pre_rollback_version)
 
             success_count = 0
             error_count = 0
 
             # Step 1: Delete all current resources in TeamB (in reverse order)
-            current_resources_sorted = sorted(
-                rollback_plan['resources_to_delete'],
-                key=lambda r: r.get('order', 0),
-                reverse=True
-            )
+            current_resources_sorted = self._sorted_by_order(rollback_plan['resources_to_delete'], reverse=True)
 
             for resource in current_resources_sorted:
                 try:
                     resource_id = resource.get('id')
                     resource_name = resource.get('name', 'Unknown')
                     if resource_id:
-                        self.logger.info(f"Deleting current resource: {resource_name}")
+                        self.logger.info("Deleting current resource: %s", resource_name)
                         self.delete_resource_from_teamb(resource_id)
                         success_count += 1
                 except Exception as e:
-                    self.logger.error(f"Failed to delete resource {resource.get('name', 'Unknown')}: {e}")
+                    self.logger.error("Failed to delete resource %s: %s", resource.get('name', 'Unknown'), e)
                     error_count += 1
 
             # Step 2: Create target resources in TeamB (in proper order)
@@ -622,11 +832,11 @@ class ParsingRulesService(BaseService):
                 try:
                     resource_name = resource.get('name', 'Unknown')
                     resource_order = resource.get('order', 'N/A')
-                    self.logger.info(f"Creating target resource: {resource_name} (order: {resource_order})")
+                    self.logger.info("Creating target resource: %s (order: %s)", resource_name, resource_order)
                     self.create_resource_in_teamb(resource)
                     success_count += 1
                 except Exception as e:
-                    self.logger.error(f"Failed to create resource {resource.get('name', 'Unknown')}: {e}")
+                    self.logger.error("Failed to create resource %s: %s", resource.get('name', 'Unknown'), e)
                     error_count += 1
 
             # Create post-rollback snapshot
@@ -635,18 +845,20 @@ class ParsingRulesService(BaseService):
                 post_rollback_version = self.version_manager.create_version_snapshot(
                     [], final_teamb_resources, 'post_rollback'
                 )
-                self.logger.info(f"Post-rollback snapshot created: {post_rollback_version}")
+                self.logger.info("Post-rollback snapshot created: %s", post_rollback_version)
             except Exception as e:
-                self.logger.warning(f"Failed to create post-rollback snapshot: {e}")
+                self.logger.warning("Failed to create post-rollback snapshot: %s", e)
 
             rollback_success = error_count == 0
-            self.logger.info(f"Rollback completed. Success: {rollback_success}, Operations: {success_count}, Errors: {error_count}")
+            self.logger.info("Rollback completed. Success: %s, Operations: %s, Errors: %s", rollback_success, success_count, error_count)
 
             return rollback_success
 
         except Exception as e:
-            self.logger.error(f"Rollback failed: {e}")
+            self.logger.error("Rollback failed: %s", e)
             return False
+        finally:
+            self._close_failed_rules_log()
 
     def dry_run(self) -> Dict[str, Any]:
         """
@@ -656,22 +868,31 @@ class ParsingRulesService(BaseService):
         Returns:
             Dictionary containing dry run results
         """
+        if self._mode == 'diff_sync':
+            return self._dry_run_diff_sync()
+
         try:
             self.log_migration_start(self.service_name, dry_run=True)
+            self._clear_resource_caches()
 
             # Step 0: Basic safety verification
             self._verify_basic_safety()
 
             # Fetch current resources from both teams
-            self.logger.info("Fetching resources from Team A...")
-            teama_resources = self.fetch_resources_from_teama()
-
-            self.logger.info("Fetching resources from Team B...")
-            teamb_resources = self.fetch_resources_from_teamb()
-
-            # Save artifacts for comparison
-            self.save_artifacts(teama_resources, 'teama')
-            self.save_artifacts(teamb_resources, 'teamb')
+            teama_resources, teamb_resources = self._fetch_resources_from_both_teams()
+
+            # Save artifacts for comparison; the two writes are independent, so run them side by side.
+            # Preview-only runs can turn this off, since nothing is changed that would need a backup.
+            if self.config.persist_dry_run_artifacts:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    artifact_futures = [
+                        executor.submit(self.save_artifacts, teama_resources, 'teama'),
+                        executor.submit(self.save_artifacts, teamb_resources, 'teamb'),
+                    ]
+                    for artifact_future in artifact_futures:
+                        artifact_future.result()
+            else:
+                self.logger.info("Skipping dry run artifacts (PERSIST_DRY_RUN_ARTIFACTS=false)")
 
             # For delete & recreate all pattern, we delete ALL TeamB and create ALL TeamA
             results = {
@@ -683,33 +904,22 @@ class ParsingRulesService(BaseService):
             }
 
             # Log summary with new approach
-            self.logger.info("DRY RUN RESULTS - PARSING RULE GROUPS")
-            self.logger.info("=" * 60)
-            self.logger.info(f"📊 Team A rule groups: {len(teama_resources)}")
-            self.logger.info(f"📊 Team B rule groups: {len(teamb_resources)}")
-            self.logger.info(f"🗑️ Rule groups to delete from Team B: {len(teamb_resources)}")
-
-            if teamb_resources:
-                self.logger.info("   Deleting ALL existing rule groups:")
-                for resource in sorted(teamb_resources, key=lambda r: r.get('order', 0)):
-                    name = resource.get('name', 'Unknown')
-                    order = resource.get('order', 'N/A')
-                    resource_id = resource.get('id', 'N/A')
-                    self.logger.info(f"   - {name} (ID: {resource_id}, Order: {order})")
-
-            self.logger.info(f"📄 Rule groups to create from Team A: {len(teama_resources)}")
-
-            if teama_resources:
-                self.logger.info("   Creating ALL rule groups in proper order:")
-                for resource in sorted(teama_resources, key=lambda r: r.get('order', 0)):
-                    name = resource.get('name', 'Unknown')
-                    order = resource.get('order', 'N/A')
-                    resource_id = resource.get('id', 'N/A')
-                    self.logger.info(f"   + {name} (ID: {resource_id}, Order: {order})")
+            self.logger.info(
+                "Dry run plan - Delete & Recreate All",
+                total_teama_resources=len(teama_resources),
+                total_teamb_resources=len(teamb_resources),
+                rule_groups_to_delete=len(teamb_resources),
+                rule_groups_to_create=len(teama_resources),
+                total_operations=results['total_operations']
+            )
 
-            self.logger.info(f"📋 Total operations planned: {results['total_operations']}")
-            self.logger.info(f"  - Delete: {len(teamb_resources)}")
-            self.logger.info(f"  - Create: {len(teama_resources)}")
+            # The per-rule-group listing is printed by display_dry_run_results; only log it when debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                debug, name_id_order = self.logger.debug, self._name_id_order
+                for resource in self._sorted_by_order(teamb_resources):
+                    debug("   - %s (ID: %s, Order: %s)", *name_id_order(resource))
+                for resource in self._sorted_by_order(teama_resources):
+                    debug("   + %s (ID: %s, Order: %s)", *name_id_order(resource))
 
             if len(teama_resources) == 0 and len(teamb_resources) == 0:
                 self.logger.info("✨ No rule groups to migrate - both teams have 0 rule groups")
@@ -723,7 +933,7 @@ class ParsingRulesService(BaseService):
             return results
 
         except Exception as e:
-            self.logger.error(f"Dry run failed: {e}")
+            self.logger.error("Dry run failed: %s", e)
             self.log_migration_complete(self.service_name, False, 0, 1)
             return {
                 'teama_count': 0,
@@ -734,6 +944,12 @@ class ParsingRulesService(BaseService):
                 'error': str(e)
             }
 
+    @staticmethod
+    def _name_id_order(resource: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+        """Return a rule group's (name, id, order) for display, with placeholders for missing values."""
+        get = resource.get
+        return get('name', 'Unknown'), get('id', 'N/A'), get('order', 'N/A')
+
     def display_dry_run_results(self, results: Dict[str, Any]):
         """
         Display formatted dry run results.
@@ -741,40 +957,396 @@ class ParsingRulesService(BaseService):
         Args:
             results: Dry run results dictionary
         """
-        print("\n" + "=" * 60)
-        print("DRY RUN RESULTS - PARSING RULE GROUPS (DELETE & RECREATE ALL)")
-        print("=" * 60)
+        if 'to_recreate' in results:
+            self._display_diff_sync_results(results)
+            return
 
-        print(f"📊 Team A rule groups: {results['teama_count']}")
-        print(f"📊 Team B rule groups: {results['teamb_count']}")
+        # Build the whole report first and write it in one call instead of a print per line
+        to_delete = results.get('to_delete') or []
+        to_create = results.get('to_create') or []
 
-        if results.get('to_delete'):
-            print(f"🗑️ Rule groups to delete from Team B: {len(results['to_delete'])}")
-            for resource in sorted(results['to_delete'], key=lambda r: r.get('order', 0)):
-                name = resource.get('name', 'Unknown')
-                order = resource.get('order', 'N/A')
-                resource_id = resource.get('id', 'N/A')
-                print(f"  - {name} (ID: {resource_id}, Order: {order})")
+        lines = [
+            "",
+            "=" * 60,
+            "DRY RUN RESULTS - PARSING RULE GROUPS (DELETE & RECREATE ALL)",
+            "=" * 60,
+            "📊 Team A rule groups: %s" % results['teama_count'],
+            "📊 Team B rule groups: %s" % results['teamb_count'],
+        ]
 
-        if results.get('to_create'):
-            print(f"📄 Rule groups to create from Team A: {len(results['to_create'])}")
-            for resource in sorted(results['to_create'], key=lambda r: r.get('order', 0)):
-                name = resource.get('name', 'Unknown')
-                order = resource.get('order', 'N/A')
-                resource_id = resource.get('id', 'N/A')
-                print(f"  + {name} (ID: {resource_id}, Order: {order})")
+        name_id_order = self._name_id_order
 
-        print(f"📋 Total operations planned: {results['total_operations']}")
+        if to_delete:
+            lines.append("🗑️ Rule groups to delete from Team B: %d" % len(to_delete))
+            lines.extend("  - %s (ID: %s, Order: %s)" % name_id_order(resource)
+                         for resource in self._sorted_by_order(to_delete))
+
+        if to_create:
+            lines.append("📄 Rule groups to create from Team A: %d" % len(to_create))
+            lines.extend("  + %s (ID: %s, Order: %s)" % name_id_order(resource)
+                         for resource in self._sorted_by_order(to_create))
+
+        lines.append("📋 Total operations planned: %s" % results['total_operations'])
 
         if results['total_operations'] > 0:
-            print(f"  - Delete: {len(results.get('to_delete', []))}")
-            print(f"  - Create: {len(results.get('to_create', []))}")
-            print("\n⚠️  IMPORTANT: ALL existing rule groups in Team B will be DELETED and recreated from Team A")
-            print("🎯 This ensures perfect order synchronization and rule consistency")
+            lines.append("  - Delete: %d" % len(to_delete))
+            lines.append("  - Create: %d" % len(to_create))
+            lines.append("")
+            lines.append("⚠️  IMPORTANT: ALL existing rule groups in Team B will be DELETED and recreated from Team A")
+            lines.append("🎯 This ensures perfect order synchronization and rule consistency")
         else:
-            print("✨ No operations needed - both teams have 0 rule groups")
+            lines.append("✨ No operations needed - both teams have 0 rule groups")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def _migrate_diff_sync(self) -> bool:
+        """
+        Migrate only the rule groups that differ between Team A and Team B.
+
+        1. Delete rule groups that no longer exist in Team A
+        2. Delete and recreate rule groups whose content changed
+        3. Create rule groups that are new in Team A
+
+        Returns:
+            True if migration completed successfully
+        """
+        try:
+            self.log_migration_start(self.service_name, dry_run=False)
+            self._clear_resource_caches()
+            self._verify_basic_safety()
+
+            teama_resources, teamb_resources = self._fetch_resources_from_both_teams()
+            teamb_count = len(teamb_resources)
+
+            pre_migration_version = self.version_manager.create_version_snapshot(
+                teama_resources, teamb_resources, 'pre_migration'
+            )
+            self.logger.info("Pre-migration snapshot created: %s", pre_migration_version)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                artifact_futures = [
+                    executor.submit(self.save_artifacts, teama_resources, 'teama'),
+                    executor.submit(self.save_artifacts, teamb_resources, 'teamb'),
+                ]
+                for artifact_future in artifact_futures:
+                    artifact_future.result()
+
+            comparison = self._compare_rule_groups(teama_resources, teamb_resources)
+
+            # Mass deletion safety check: changed and reordered rule groups are deleted before
+            # being recreated, so they count towards the deletions alongside the removed ones
+            current_version = self.version_manager.get_current_version()
+            previous_teama_count = current_version.get('teama', {}).get('count') if current_version else None
+
+            replaced_pairs = comparison['changed_resources'] + comparison['reordered_resources']
+            resources_to_delete = comparison['deleted_from_teama'] + [teamb for _, teamb in replaced_pairs]
+            mass_deletion_check = self.safety_manager.check_mass_deletion_safety(
+                resources_to_delete, len(teamb_resources), len(teama_resources), previous_teama_count
+            )
+
+            if not mass_deletion_check.is_safe:
+                self.logger.error("Mass deletion safety check failed: %s", mass_deletion_check.reason)
+                self.logger.error("Safety check details: %s", mass_deletion_check.details)
+                raise RuntimeError(f"Mass deletion safety check failed: {mass_deletion_check.reason}")
+
+            self.logger.info(
+                "Migration plan - Diff & Sync",
+                total_teama_resources=len(teama_resources),
+                total_teamb_resources=len(teamb_resources),
+                new_resources=len(comparison['new_in_teama']),
+                changed_resources=len(comparison['changed_resources']),
+                reordered_resources=len(comparison['reordered_resources']),
+                deleted_resources=len(comparison['deleted_from_teama']),
+                skipped_empty_resources=len(comparison['skipped_empty'])
+            )
+
+            delete_count = 0
+            recreate_count = 0
+            reorder_count = 0
+            create_success_count = 0
+            skipped_count = len(comparison['skipped_empty'])
+            error_count = 0
+
+            if skipped_count:
+                self.logger.info("⚠️  Skipping %s rule group(s) with no ruleSubgroups (API requires at least 1 rule)", skipped_count)
+                for resource in comparison['skipped_empty']:
+                    self.logger.info("⚠️  Skipped rule group '%s' - no_rules", resource.get('name', 'Unknown'))
+
+            # Handle deleted resources (exist in Team B but not in Team A)
+            for teamb_resource in self._sorted_by_order(comparison['deleted_from_teama'], reverse=True):
+                resource_id = teamb_resource.get('id')
+                if resource_id and self._delete_resource_with_retry(resource_id, teamb_resource.get('name', 'Unknown')):
+                    delete_count += 1
+                elif resource_id:
+                    error_count += 1
+
+            # Remove the Team B copies of changed and reordered rule groups before any create, so
+            # the recreated rule groups all land after the ones that stay in place
+            replaced_kind = {}
+            undeleted_names = set()
+            for teama_resource, teamb_resource in replaced_pairs:
+                resource_name = teama_resource.get('name', 'Unknown')
+                teamb_id = teamb_resource.get('id')
+                if teamb_id and not self._delete_resource_with_retry(teamb_id, resource_name):
+                    self.logger.error("Failed to delete the existing Team B rule group %s (%s); not recreating it", resource_name, teamb_id)
+                    undeleted_names.add(resource_name)
+                    error_count += 1
+            for teama_resource, _ in comparison['changed_resources']:
+                replaced_kind[id(teama_resource)] = 'changed'
+            for teama_resource, _ in comparison['reordered_resources']:
+                replaced_kind[id(teama_resource)] = 'reordered'
+
+            # Create new, changed and reordered rule groups in a single pass in Team A order
+            to_create = comparison['new_in_teama'] + [teama for teama, _ in replaced_pairs]
+            for teama_resource in self._sort_resources_by_order(to_create):
+                resource_name = teama_resource.get('name', 'Unknown')
+                if resource_name in undeleted_names:
+                    continue
+                kind = replaced_kind.get(id(teama_resource), 'new')
+
+                try:
+                    result = self.create_resource_in_teamb(teama_resource)
+                    if isinstance(result, dict) and result.get('skipped'):
+                        skipped_count += 1
+                        self.logger.info("⚠️  Skipped rule group '%s' - %s", resource_name, result.get('reason'))
+                    elif kind == 'changed':
+                        recreate_count += 1
+                    elif kind == 'reordered':
+                        reorder_count += 1
+                    else:
+                        create_success_count += 1
+                except Exception as e:
+                    self.logger.error("Failed to create %s rule group %s: %s", kind, resource_name, e)
+                    error_count += 1
+
+            # Verify the final TeamB state matches Team A, less the rule groups that were skipped
+            self.logger.info("🔍 Verifying Team B rule groups after diff & sync...")
+            final_teamb_resources = self.fetch_resources_from_teamb()
+
+            expected_count = len(teama_resources) - skipped_count
+            actual_count = len(final_teamb_resources)
+
+            if actual_count != expected_count:
+                self.logger.error("❌ Sync verification failed: Expected %s rule groups (skipped %s), but found %s in Team B", expected_count, skipped_count, actual_count)
+                raise RuntimeError(f"Sync verification failed: Expected {expected_count} rule groups, but found {actual_count}")
+
+            # Rule groups are evaluated in order, so Team B must also list them in Team A's order
+            expected_names = [resource.get('name') for resource in sorted(
+                (resource for resource in teama_resources if resource.get('ruleSubgroups')), key=self._creation_order_key)]
+            actual_names = [resource.get('name') for resource in self._sorted_by_order(final_teamb_resources)]
+            if actual_names != expected_names:
+                self.logger.error("❌ Sync verification failed: Team B rule group order does not match Team A")
+                raise RuntimeError("Sync verification failed: Team B rule group order does not match Team A")
+            self.logger.info("✅ Sync verification passed: %s rule groups in Team B in Team A order (skipped %s empty rule groups)", actual_count, skipped_count)
+
+            self.logger.info("💾 Saving final Team B state to outputs...")
+            self.save_artifacts(final_teamb_resources, "teamb_final")
+
+            try:
+                self.logger.info("Creating post-migration version snapshot...")
+                post_migration_version = self.version_manager.create_version_snapshot(
+                    teama_resources, final_teamb_resources, 'post_migration'
+                )
+                self.logger.info("Post-migration snapshot created: %s", post_migration_version)
+            except Exception as e:
+                self.logger.warning("Failed to create post-migration snapshot: %s", e)
+
+            migration_success = error_count == 0
+            self.log_migration_complete(
+                self.service_name,
+                migration_success,
+                delete_count + recreate_count + reorder_count + create_success_count,
+                error_count
+            )
+
+            # Print user-visible migration summary
+            print("\n" + "=" * 60)
+            print("MIGRATION RESULTS - PARSING RULE GROUPS (DIFF & SYNC)")
+            print("=" * 60)
+            print(f"📊 Team A rule groups: {len(teama_resources)}")
+            print(f"📊 Team B rule groups (before): {teamb_count}")
+            print(f"📊 Team B rule groups (after): {actual_count}")
+            print(f"🗑️  Deleted from Team B: {delete_count}")
+            print(f"🔄 Recreated (changed): {recreate_count}")
+            print(f"↕️  Recreated (to restore order): {reorder_count}")
+            print(f"✅ Created (new): {create_success_count}")
+            if skipped_count > 0:
+                print(f"⚠️  Skipped (empty rule groups): {skipped_count}")
+            if error_count > 0:
+                print(f"❌ Failed: {error_count}")
+            print(f"📋 Total operations: {delete_count + recreate_count + reorder_count + create_success_count + skipped_count + error_count}")
+
+            if migration_success:
+                print("\n✅ Migration completed successfully!")
+                if skipped_count > 0:
+                    print(f"   Note: {skipped_count} empty rule group(s) were skipped (no rules to migrate)")
+            else:
+                print("\n❌ Migration completed with errors!")
+                print(f"   {error_count} rule group operation(s) failed")
+
+            print("=" * 60 + "\n")
+
+            return migration_success
+
+        except Exception as e:
+            self.logger.error("Migration failed: %s", e)
+            self.log_migration_complete(self.service_name, False, 0, 1)
+            return False
+        finally:
+            self._close_failed_rules_log()
+
+    def _dry_run_diff_sync(self) -> Dict[str, Any]:
+        """
+        Dry run of the diff & sync strategy: report which rule groups would be
+        created, recreated or deleted without making changes.
+
+        Returns:
+            Dictionary containing dry run results
+        """
+        try:
+            self.log_migration_start(self.service_name, dry_run=True)
+            self._clear_resource_caches()
+            self._verify_basic_safety()
+
+            teama_resources, teamb_resources = self._fetch_resources_from_both_teams()
+
+            if self.config.persist_dry_run_artifacts:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    artifact_futures = [
+                        executor.submit(self.save_artifacts, teama_resources, 'teama'),
+                        executor.submit(self.save_artifacts, teamb_resources, 'teamb'),
+                    ]
+                    for artifact_future in artifact_futures:
+                        artifact_future.result()
+
+            comparison = self._compare_rule_groups(teama_resources, teamb_resources)
+
+            results = {
+                'teama_count': len(teama_resources),
+                'teamb_count': len(teamb_resources),
+                'to_create': comparison['new_in_teama'],
+                'to_recreate': comparison['changed_resources'],
+                'to_reorder': comparison['reordered_resources'],
+                'to_delete': comparison['deleted_from_teama'],
+                'skipped_empty': comparison['skipped_empty'],
+                'total_operations': (len(comparison['new_in_teama']) + len(comparison['changed_resources'])
+                                     + len(comparison['reordered_resources']) + len(comparison['deleted_from_teama']))
+            }
+
+            self.logger.info(
+                "Dry run plan - Diff & Sync",
+                total_teama_resources=len(teama_resources),
+                total_teamb_resources=len(teamb_resources),
+                new_resources=len(results['to_create']),
+                changed_resources=len(results['to_recreate']),
+                reordered_resources=len(results['to_reorder']),
+                deleted_resources=len(results['to_delete']),
+                skipped_empty_resources=len(results['skipped_empty']),
+                total_operations=results['total_operations']
+            )
+
+            self.log_migration_complete(self.service_name, True, len(teama_resources), 0)
+            return results
+
+        except Exception as e:
+            self.logger.error("Dry run failed: %s", e)
+            self.log_migration_complete(self.service_name, False, 0, 1)
+            return {
+                'teama_count': 0,
+                'teamb_count': 0,
+                'to_create': [],
+                'to_recreate': [],
+                'to_reorder': [],
+                'to_delete': [],
+                'skipped_empty': [],
+                'total_operations': 0,
+                'error': str(e)
+            }
+
+    def _display_diff_sync_results(self, results: Dict[str, Any]):
+        """Display formatted dry run results of the diff & sync strategy."""
+        to_create = results.get('to_create') or []
+        to_recreate = results.get('to_recreate') or []
+        to_reorder = results.get('to_reorder') or []
+        to_delete = results.get('to_delete') or []
+        skipped_empty = results.get('skipped_empty') or []
+
+        lines = [
+            "",
+            "=" * 60,
+            "DRY RUN RESULTS - PARSING RULE GROUPS (DIFF & SYNC)",
+            "=" * 60,
+            "📊 Team A rule groups: %s" % results['teama_count'],
+            "📊 Team B rule groups: %s" % results['teamb_count'],
+        ]
+
+        if to_create:
+            lines.append("✅ New rule groups to create in Team B: %d" % len(to_create))
+            lines.extend("  + %s (ID: %s, Order: %s)" % self._name_id_order(resource)
+                         for resource in self._sorted_by_order(to_create))
+
+        if to_recreate:
+            lines.append("🔄 Changed rule groups to recreate in Team B: %d" % len(to_recreate))
+            lines.extend("  ~ %s (Team A ID: %s, Team B ID: %s)" % (
+                teama_resource.get('name', 'Unknown'), teama_resource.get('id', 'N/A'), teamb_resource.get('id', 'N/A'))
+                for teama_resource, teamb_resource in to_recreate)
+
+        if to_reorder:
+            lines.append("↕️  Unchanged rule groups to recreate to restore Team A order: %d" % len(to_reorder))
+            lines.extend("  ^ %s (Team A ID: %s, Team B ID: %s)" % (
+                teama_resource.get('name', 'Unknown'), teama_resource.get('id', 'N/A'), teamb_resource.get('id', 'N/A'))
+                for teama_resource, teamb_resource in sorted(to_reorder, key=lambda pair: self._creation_order_key(pair[0])))
+
+        if to_delete:
+            lines.append("🗑️ Rule groups to delete from Team B: %d" % len(to_delete))
+            lines.extend("  - %s (ID: %s, Order: %s)" % self._name_id_order(resource)
+                         for resource in self._sorted_by_order(to_delete))
+
+        if skipped_empty:
+            lines.append("⚠️  Empty rule groups to skip (no ruleSubgroups): %d" % len(skipped_empty))
+            lines.extend("  ! %s (ID: %s, Order: %s)" % self._name_id_order(resource)
+                         for resource in self._sorted_by_order(skipped_empty))
+
+        lines.append("📋 Total operations planned: %s" % results['total_operations'])
+
+        if results['total_operations'] > 0:
+            lines.append("  - Create: %d" % len(to_create))
+            lines.append("  - Recreate: %d" % len(to_recreate))
+            lines.append("  - Reorder: %d" % len(to_reorder))
+            lines.append("  - Delete: %d" % len(to_delete))
+        else:
+            lines.append("✨ No changes detected - Team B is already in sync with Team A")
+
+        lines.append("=" * 60)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._close_failed_rules_log()
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+    def _index_by_name(self, resources: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Index rule groups by name, which is how they are matched across teams.
+
+        Returns:
+            Tuple of (rule groups by name, rule groups that can't be matched by name). The
+            latter are the rule groups without a name and every repeat of a name after the
+            first, instead of being collapsed under a None key or silently dropped.
+        """
+        by_name: Dict[str, Dict[str, Any]] = {}
+        unmatched: List[Dict[str, Any]] = []
+        for resource in resources:
+            name = resource.get('name')
+            if name is None or name in by_name:
+                unmatched.append(resource)
+            else:
+                by_name[name] = resource
+        return by_name, unmatched
 
     def _compare_rule_groups(self, teama_resources: List[Dict[str, Any]], teamb_resources: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -784,34 +1356,74 @@ class ParsingRulesService(BaseService):
             Dictionary with:
             - new_in_teama: Resources that exist in Team A but not in Team B
             - changed_resources: Resources that exist in both but are different
-            - deleted_from_teama: Resources that exist in Team B but not in Team A
+            - reordered_resources: Resources that are the same in both but have to be
+              recreated so Team B ends up in Team A's order
+            - deleted_from_teama: Resources that exist in Team B but not in Team A, plus
+              Team B rule groups that can't be matched by name (nameless or duplicates)
+            - skipped_empty: Team A resources with no ruleSubgroups, which the API rejects
+
+            The lists are in no particular order; sort them before acting on them.
+            Empty Team A rule groups are left out of the matching, so a Team B copy of
+            one is deleted - the same end state as the delete & recreate-all flow.
+
+        Raises:
+            RuntimeError: If Team A has rule groups without a name or with a duplicate name,
+                which can't be matched to Team B and would fail post-migration verification
         """
-        # Create lookup dictionaries by name (rule groups are identified by name)
-        teama_by_name = {resource.get('name'): resource for resource in teama_resources}
-        teamb_by_name = {resource.get('name'): resource for resource in teamb_resources}
-
-        new_in_teama = []
+        migratable, skipped_empty = [], []
+        for resource in teama_resources:
+            (migratable if resource.get('ruleSubgroups') else skipped_empty).append(resource)
+
+        teama_by_name, teama_unmatched = self._index_by_name(migratable)
+        if teama_unmatched:
+            for resource in teama_unmatched:
+                self.logger.error("Team A rule group can't be matched by name (missing or duplicate): name=%s, id=%s",
+                                  resource.get('name'), resource.get('id'))
+            raise RuntimeError(f"Diff & sync needs unique rule group names in Team A; "
+                               f"{len(teama_unmatched)} rule group(s) are nameless or duplicates")
+
+        # Nameless and duplicate Team B rule groups have no Team A counterpart, so they are deleted by id
+        teamb_by_name, teamb_unmatched = self._index_by_name(teamb_resources)
+        if teamb_unmatched:
+            self.logger.warning("%s Team B rule group(s) are nameless or duplicates and will be deleted", len(teamb_unmatched))
+
+        # Key views support set operations, so each bucket comes from one C-level set operation
+        teama_names = teama_by_name.keys()
+        teamb_names = teamb_by_name.keys()
+
+        new_in_teama = [teama_by_name[name] for name in teama_names - teamb_names]
+        deleted_from_teama = [teamb_by_name[name] for name in teamb_names - teama_names]
+        deleted_from_teama.extend(teamb_unmatched)
+
+        # Each rule group is fingerprinted once (and cached by id), so detecting a change is a
+        # digest comparison rather than a deep walk of both rule groups
+        fingerprint = self._canonical_hash
         changed_resources = []
-        deleted_from_teama = []
-
-        # Find new and changed resources
-        for name, teama_resource in teama_by_name.items():
-            if name not in teamb_by_name:
-                # Resource exists in Team A but not in Team B - new
-                new_in_teama.append(teama_resource)
+        unchanged_names = set()
+        for name in teama_names & teamb_names:
+            if fingerprint(teama_by_name[name]) != fingerprint(teamb_by_name[name]):
+                changed_resources.append((teama_by_name[name], teamb_by_name[name]))
             else:
-                # Resource exists in both teams - check if changed
-                teamb_resource = teamb_by_name[name]
-                if not self.resources_are_equal(teama_resource, teamb_resource):
-                    changed_resources.append((teama_resource, teamb_resource))
-
-        # Find deleted resources (exist in Team B but not in Team A)
-        for name, teamb_resource in teamb_by_name.items():
-            if name not in teama_by_name:
-                deleted_from_teama.append(teamb_resource)
+                unchanged_names.add(name)
+
+        # Created rule groups land after the existing ones, so an unchanged rule group can only
+        # stay where it is if it is part of the run of unchanged rule groups that already opens
+        # both teams in the same order. The rest are recreated in Team A order after that run.
+        teama_sequence = sorted(teama_by_name.values(), key=self._creation_order_key)
+        teamb_unchanged = [resource for resource in self._sorted_by_order(teamb_by_name.values())
+                           if resource['name'] in unchanged_names]
+        in_place = set()
+        for teama_resource, teamb_resource in zip(teama_sequence, teamb_unchanged):
+            if teama_resource['name'] != teamb_resource['name']:
+                break
+            in_place.add(teama_resource['name'])
+
+        reordered_resources = [(teama_by_name[name], teamb_by_name[name]) for name in unchanged_names - in_place]
 
         return {
             'new_in_teama': new_in_teama,
             'changed_resources': changed_resources,
-            'deleted_from_teama': deleted_from_teama
+            'reordered_resources': reordered_resources,
+            'deleted_from_teama': deleted_from_teama,
+            'skipped_empty': skipped_empty
         }
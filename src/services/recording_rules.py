@@ -11,25 +11,71 @@ It supports:
 - Failed operations logging with exponential backoff
 """
 
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-import json
+import hashlib
+import random
+import threading
 import time
 
+from core import json_utils
 from core.base_service import BaseService
 from core.config import Config
 from core.api_client import CoralogixAPIError
+from core.rate_limiter import TokenBucket
 from core.safety_manager import SafetyManager
 from core.version_manager import VersionManager
 
 
+@dataclass(slots=True)
+class MigrationStats:
+    """Counters for one recording rules run, saved for the summary table."""
+    teama_count: int = 0
+    teamb_before: int = 0
+    teamb_after: int = 0
+    created: int = 0
+    deleted: int = 0
+    failed: int = 0
+
+
 class RecordingRulesService(BaseService):
     """Service for migrating recording rule group sets between teams."""
 
+    # Read-only or system-generated fields, found on sets, groups and rules alike.
+    # They are left out of create requests and ignored when comparing sets.
+    _READ_ONLY_FIELDS = frozenset({
+        'id',  # System-generated field
+        'lastEvalDurationMs',  # Read-only field that causes 400 Bad Request (in rules)
+        'lastEvalAt',  # Read-only field that causes 400 Bad Request (in groups)
+        'lastEvalTime',  # Read-only field
+        'createdAt',  # System-generated timestamp
+        'updatedAt',  # System-generated timestamp
+        'createdBy',  # System-generated field
+        'updatedBy'   # System-generated field
+    })
+
     def __init__(self, config: Config, logger):
         super().__init__(config, logger)
         self._setup_failed_rules_logging()
 
+        # Deletes and creates are independent per rule group set, so they run on a
+        # bounded worker pool; the token bucket keeps the pool within the API rate limit
+        self.max_concurrent_operations = max(1, config.recording_rules_parallelism)
+        self._rate_limiter = TokenBucket(rate=config.api_rate_limit_per_second, capacity=20)
+
+        # Adaptive pacing shared by all workers: 429s cut the token bucket rate,
+        # successes ramp it back up towards the configured limit
+        self._pacing_lock = threading.Lock()
+        self._max_request_rate = float(config.api_rate_limit_per_second)
+
+        # Per-run caches of create payloads and fingerprints, keyed by rule group set id
+        self._prepared_cache: Dict[str, Dict[str, Any]] = {}
+        self._hash_cache: Dict[str, str] = {}
+        self._order_insensitive = config.recording_rules_order_insensitive
+
         # Initialize safety manager and version manager
         self.safety_manager = SafetyManager(config, self.service_name)
         self.version_manager = VersionManager(config, self.service_name)
@@ -43,10 +89,20 @@ class RecordingRulesService(BaseService):
         return "/latest/v1/rule-group-sets"
     
     def _setup_failed_rules_logging(self):
-        """Setup logging directory for failed recording rules."""
+        """Setup logging directory and per-run log file for failed recording rules."""
         self.failed_rules_dir = Path("logs/recording_rules")
         self.failed_rules_dir.mkdir(parents=True, exist_ok=True)
 
+        # One JSON Lines file per run, named once here rather than on every failure
+        self._run_started_at = datetime.now()
+        run_stamp = f"{self._run_started_at:%Y%m%d_%H%M%S}"
+        self.failed_log_file = self.failed_rules_dir / f"failed_recording_rules_{run_stamp}.jsonl"
+        self.failed_summary_file = self.failed_rules_dir / f"failed_recording_rules_{run_stamp}_summary.json"
+
+        # Failures are appended from several worker threads
+        self._failed_log_lock = threading.Lock()
+        self._failed_counts: Dict[str, int] = {}
+
     def fetch_resources_from_teama(self) -> List[Dict[str, Any]]:
         """Fetch all recording rule group sets from Team A with safety checks."""
         api_error = None
@@ -126,6 +182,23 @@ class RecordingRulesService(BaseService):
             self.logger.error(f"Unexpected error fetching recording rule group sets from Team B: {e}")
             raise
     
+    def _fetch_resources_from_both_teams(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch rule group sets from Team A and Team B concurrently.
+
+        The two fetches hit different API clients and don't depend on each other,
+        so the setup phase takes as long as the slower one instead of both combined.
+
+        Returns:
+            Tuple of (teama_resources, teamb_resources)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            teama_future = executor.submit(self.fetch_resources_from_teama)  # This includes safety checks
+            teamb_future = executor.submit(self.fetch_resources_from_teamb)
+
+            # Team A is resolved first so its safety check failures take precedence
+            return teama_future.result(), teamb_future.result()
+
     def create_resource_in_teamb(self, resource: Dict[str, Any]) -> Dict[str, Any]:
         """Create a recording rule group set in Team B with exponential backoff and delay."""
         try:
@@ -161,7 +234,7 @@ class RecordingRulesService(BaseService):
             self.logger.info(f"Deleting recording rule group set from Team B: {resource_id}")
 
             # Delete the rule group set
-            self.teamb_client.delete(f"{self.api_endpoint}/{resource_id}")
+            self._retry_with_backoff(lambda: self.teamb_client.delete(f"{self.api_endpoint}/{resource_id}"))
 
             self.log_resource_action("delete", "recording_rule_group_set", resource_id, True)
             return True
@@ -171,34 +244,67 @@ class RecordingRulesService(BaseService):
             raise
     
     def _add_creation_delay(self):
-        """Add a small delay before creation to avoid overwhelming the API."""
-        import time
-        delay_seconds = 0.5  # 500ms delay between creations
-        time.sleep(delay_seconds)
+        """Wait for a token from the rate limiter before a creation to avoid overwhelming the API."""
+        self._rate_limiter.acquire()
 
-    def _retry_with_exponential_backoff(self, operation, max_retries: int = 3):
-        """Retry an operation with exponential backoff."""
-        import time
+    def _record_api_outcome(self, error: Optional[Exception] = None):
+        """
+        Adapt the shared request rate to the API's responses.
+
+        A 429 halves the token bucket rate and drains it, pausing every worker until
+        the bucket refills; each success ramps the rate back up by 10%.
+        """
+        status_code = getattr(error, 'status_code', None)
+        with self._pacing_lock:
+            if error is None:
+                if self._rate_limiter.rate < self._max_request_rate:
+                    self._rate_limiter.set_rate(min(self._max_request_rate, self._rate_limiter.rate * 1.1))
+            elif status_code == 429:
+                self._rate_limiter.set_rate(max(0.5, self._rate_limiter.rate * 0.5), drain=True)
+
+    @staticmethod
+    def _is_retriable_error(error: Exception) -> bool:
+        """Client errors other than 429 won't succeed on retry, so fail fast on them."""
+        if isinstance(error, CoralogixAPIError) and error.status_code is not None:
+            return not (400 <= error.status_code < 500) or error.status_code == 429
+        return True
+
+    def _retry_with_backoff(self, operation, max_retries: int = 3,
+                            base_wait: float = 0.5, max_wait: float = 20.0):
+        """
+        Retry an operation with decorrelated-jitter exponential backoff.
+
+        Each wait is drawn from [base_wait, previous_wait * 3] and capped at max_wait,
+        so concurrent workers don't retry in lockstep. A Retry-After value sent by
+        the API takes precedence over the computed wait.
+        """
+        wait_time = base_wait
 
         for attempt in range(max_retries):
             try:
-                return operation()
+                result = operation()
+                self._record_api_outcome()
+                return result
             except Exception as e:
-                if attempt == max_retries - 1:
+                self._record_api_outcome(e)
+                if attempt == max_retries - 1 or not self._is_retriable_error(e):
                     raise
 
-                wait_time = (2 ** attempt) * 1  # 1s, 2s, 4s
-                self.logger.warning(f"Operation failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}")
-                time.sleep(wait_time)
+                retry_after = getattr(e, 'retry_after', None)
+                if retry_after is not None:
+                    wait_time = min(max_wait, retry_after)
+                else:
+                    wait_time = min(max_wait, random.uniform(base_wait, wait_time * 3))
 
-    def _log_failed_rule_group_set(self, rule_group_set: Dict[str, Any], operation: str, error: str):
-        """Log failed rule group set operations to a separate file."""
-        import json
-        from datetime import datetime
+                self.logger.warning(f"Operation failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.2f}s: {e}")
+                time.sleep(wait_time)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        failed_log_file = self.failed_rules_dir / f"failed_recording_rules_{timestamp}.json"
+    def _retry_with_exponential_backoff(self, operation, max_retries: int = 3):
+        """Retry an operation with exponential backoff."""
+        return self._retry_with_backoff(operation, max_retries)
 
+    def _log_failed_rule_group_set(self, rule_group_set: Dict[str, Any], operation: str, error: str):
+        """Append a failed rule group set operation to the run's JSON Lines log file."""
         failed_entry = {
             "timestamp": datetime.now().isoformat(),
             "rule_group_set_id": rule_group_set.get('id', 'Unknown'),
@@ -208,169 +314,191 @@ class RecordingRulesService(BaseService):
             "rule_group_set_data": rule_group_set
         }
 
-        # Load existing failed entries or create new list
-        failed_entries = []
-        if failed_log_file.exists():
-            try:
-                with open(failed_log_file, 'r') as f:
-                    existing_data = json.load(f)
-                    failed_entries = existing_data.get('failed_rule_group_sets', [])
-            except Exception:
-                pass
+        try:
+            line = json_utils.dumps(failed_entry) + b"\n"
+            with self._failed_log_lock:
+                self._failed_counts[operation] = self._failed_counts.get(operation, 0) + 1
+                with open(self.failed_log_file, 'ab') as f:
+                    f.write(line)
+        except Exception as e:
+            self.logger.error(f"Failed to write failed rule group sets log: {e}")
 
-        failed_entries.append(failed_entry)
+    def _write_failed_rule_group_sets_summary(self):
+        """Write the per-operation failure counts once, at the end of a migration with failures."""
+        if not self._failed_counts:
+            return
 
-        # Save updated failed entries
-        failed_data = {
+        summary = {
             "timestamp": datetime.now().isoformat(),
-            "total_failed": len(failed_entries),
-            "failed_rule_group_sets": failed_entries
+            "total_failed": sum(self._failed_counts.values()),
+            "failed_by_operation": self._failed_counts
         }
 
         try:
-            with open(failed_log_file, 'w') as f:
-                json.dump(failed_data, f, indent=2)
+            with open(self.failed_summary_file, 'wb') as f:
+                f.write(json_utils.dumps(summary, indent=True))
         except Exception as e:
-            self.logger.error(f"Failed to write failed rule group sets log: {e}")
+            self.logger.error(f"Failed to write failed rule group sets summary: {e}")
 
     def _prepare_resource_for_creation(self, resource: Dict[str, Any]) -> Dict[str, Any]:
         """
         Prepare a recording rule group set resource for creation by removing fields that
         shouldn't be included in the create request.
         """
-        # Fields to exclude from creation (read-only or system-generated)
-        exclude_fields = {
-            'id',  # System-generated field
-            'lastEvalDurationMs',  # Read-only field that causes 400 Bad Request (in rules)
-            'lastEvalAt',  # Read-only field that causes 400 Bad Request (in groups)
-            'lastEvalTime',  # Read-only field
-            'createdAt',  # System-generated timestamp
-            'updatedAt',  # System-generated timestamp
-            'createdBy',  # System-generated field
-            'updatedBy'   # System-generated field
-        }
+        resource_id = resource.get('id')
+        if resource_id is not None and resource_id in self._prepared_cache:
+            return self._prepared_cache[resource_id]
 
-        # Create a copy without excluded fields
-        create_data = {
-            k: v for k, v in resource.items()
-            if k not in exclude_fields and v is not None
-        }
+        exclude_fields = self._READ_ONLY_FIELDS
+
+        def clean(item):
+            # Non-dict entries are passed through unchanged
+            if not isinstance(item, dict):
+                return item
+            return {k: v for k, v in item.items() if k not in exclude_fields and v is not None}
+
+        create_data = clean(resource)
 
         # Also clean up nested groups and rules if they exist
-        if 'groups' in create_data and isinstance(create_data['groups'], list):
+        groups = create_data.get('groups')
+        if isinstance(groups, list):
             cleaned_groups = []
-            for group in create_data['groups']:
-                if isinstance(group, dict):
-                    # Remove read-only fields from each group
-                    cleaned_group = {
-                        k: v for k, v in group.items()
-                        if k not in exclude_fields and v is not None
-                    }
-
-                    # Clean up rules within each group
-                    if 'rules' in cleaned_group and isinstance(cleaned_group['rules'], list):
-                        cleaned_rules = []
-                        for rule in cleaned_group['rules']:
-                            if isinstance(rule, dict):
-                                # Remove read-only fields from each rule
-                                cleaned_rule = {
-                                    k: v for k, v in rule.items()
-                                    if k not in exclude_fields and v is not None
-                                }
-                                cleaned_rules.append(cleaned_rule)
-                            else:
-                                cleaned_rules.append(rule)
-                        cleaned_group['rules'] = cleaned_rules
-
-                    cleaned_groups.append(cleaned_group)
-                else:
-                    cleaned_groups.append(group)
+            for group in groups:
+                cleaned_group = clean(group)
+                if isinstance(cleaned_group, dict) and isinstance(cleaned_group.get('rules'), list):
+                    cleaned_group['rules'] = [clean(rule) for rule in cleaned_group['rules']]
+                cleaned_groups.append(cleaned_group)
             create_data['groups'] = cleaned_groups
 
+        if resource_id is not None:
+            self._prepared_cache[resource_id] = create_data
+
         return create_data
 
+    def _clear_resource_caches(self):
+        """Drop cached create payloads and fingerprints so a new run starts fresh."""
+        self._prepared_cache.clear()
+        self._hash_cache.clear()
+
     def get_resource_identifier(self, resource: Dict[str, Any]) -> str:
         """Get a unique identifier for a recording rule group set."""
-        # Rule group sets are typically identified by name
-        return resource.get('name', resource.get('id', ''))
+        # Rule group sets are typically identified by name; the id is only looked up when there is none
+        if 'name' in resource:
+            return resource['name']
+        return resource.get('id', '')
 
     def resources_are_equal(self, resource_a: Dict[str, Any], resource_b: Dict[str, Any]) -> bool:
         """
         Compare two recording rule group sets to see if they are equal.
         """
-        # Fields to ignore in comparison (system-generated or metadata)
-        ignore_fields = {
-            'id',  # System-generated field
-            'lastEvalDurationMs',  # Read-only field (in rules)
-            'lastEvalAt',  # Read-only field (in groups)
-            'lastEvalTime',  # Read-only field
-            'createdAt',  # System-generated timestamp
-            'updatedAt',  # System-generated timestamp
-            'createdBy',  # System-generated field
-            'updatedBy'   # System-generated field
-        }
+        groups_a = resource_a.get('groups')
+        groups_b = resource_b.get('groups')
+        if isinstance(groups_a, list) and isinstance(groups_b, list) and len(groups_a) != len(groups_b):
+            return False
 
-        def normalize_resource(resource):
-            normalized = {}
-            for k, v in resource.items():
-                if k not in ignore_fields:
-                    if k == 'groups' and isinstance(v, list):
-                        # Normalize groups by removing ignored fields from each group and rule
-                        normalized_groups = []
-                        for group in v:
-                            if isinstance(group, dict):
-                                normalized_group = {
-                                    gk: gv for gk, gv in group.items()
-                                    if gk not in ignore_fields
-                                }
-
-                                # Also normalize rules within each group
-                                if 'rules' in normalized_group and isinstance(normalized_group['rules'], list):
-                                    normalized_rules = []
-                                    for rule in normalized_group['rules']:
-                                        if isinstance(rule, dict):
-                                            normalized_rule = {
-                                                rk: rv for rk, rv in rule.items()
-                                                if rk not in ignore_fields
-                                            }
-                                            normalized_rules.append(normalized_rule)
-                                        else:
-                                            normalized_rules.append(rule)
-                                    normalized_group['rules'] = normalized_rules
-
-                                normalized_groups.append(normalized_group)
-                            else:
-                                normalized_groups.append(group)
-                        normalized[k] = normalized_groups
-                    else:
-                        normalized[k] = v
-            return normalized
+        return self._canonical_hash(resource_a) == self._canonical_hash(resource_b)
 
-        normalized_a = normalize_resource(resource_a)
-        normalized_b = normalize_resource(resource_b)
+    def _canonical_hash(self, resource: Dict[str, Any]) -> str:
+        """Return a stable fingerprint of a rule group set's comparable fields, cached by id."""
+        resource_id = resource.get('id')
+        if resource_id is not None and resource_id in self._hash_cache:
+            return self._hash_cache[resource_id]
 
-        return normalized_a == normalized_b
+        canonical = json_utils.dumps(self._normalize_resource(resource), sort_keys=True)
+        digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+        if resource_id is not None:
+            self._hash_cache[resource_id] = digest
+
+        return digest
+
+    def _normalize_resource(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Strip the read-only fields from a rule group set and its groups and rules for comparison."""
+        ignore_fields = self._READ_ONLY_FIELDS
+
+        def strip(item):
+            # Non-dict entries are compared as-is
+            if not isinstance(item, dict):
+                return item
+            return {k: v for k, v in item.items() if k not in ignore_fields}
+
+        normalized = strip(resource)
+
+        # Normalize groups by removing ignored fields from each group and rule
+        groups = normalized.get('groups')
+        if isinstance(groups, list):
+            normalized_groups = []
+            for group in groups:
+                normalized_group = strip(group)
+                if isinstance(normalized_group, dict) and isinstance(normalized_group.get('rules'), list):
+                    normalized_group['rules'] = [strip(rule) for rule in normalized_group['rules']]
+                normalized_groups.append(normalized_group)
+
+            # Groups are evaluated independently, so their order doesn't change the set. Rules
+            # within a group run in sequence and may depend on each other, so they keep theirs.
+            if self._order_insensitive:
+                normalized_groups.sort(key=lambda g: str(g.get('name') or '') if isinstance(g, dict) else '')
+
+            normalized['groups'] = normalized_groups
+
+        return normalized
+
+    def _plan_changes(self, teama_resources: List[Dict[str, Any]],
+                      teamb_resources: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Match Team A and Team B rule group sets by canonical fingerprint.
+
+        Each Team A set consumes at most one identical Team B set, so duplicates are
+        matched one-to-one.
+
+        Returns:
+            Tuple of (Team A sets to create, Team B sets to delete)
+        """
+        unmatched: Dict[str, List[Dict[str, Any]]] = {}
+        for teamb_resource in teamb_resources:
+            unmatched.setdefault(self._canonical_hash(teamb_resource), []).append(teamb_resource)
+
+        to_create = []
+        for teama_resource in teama_resources:
+            matches = unmatched.get(self._canonical_hash(teama_resource))
+            if matches:
+                matches.pop()
+            else:
+                to_create.append(teama_resource)
+
+        to_delete = [teamb_resource for matches in unmatched.values() for teamb_resource in matches]
+        return to_create, to_delete
+
+    def _save_stats(self, stats: MigrationStats):
+        """Save migration statistics for the summary table."""
+        stats_file = self.outputs_dir / f"{self.service_name}_stats_latest.json"
+        with open(stats_file, 'wb') as f:
+            f.write(json_utils.dumps(asdict(stats), indent=True))
 
     def migrate(self) -> bool:
         """
-        Perform the actual recording rule group sets migration using delete & recreate all pattern.
+        Perform the actual recording rule group sets migration.
 
-        This approach ensures perfect synchronization by:
-        1. Deleting ALL existing rule group sets from Team B
-        2. Recreating ALL rule group sets from Team A
+        Rule group sets are matched across teams by canonical fingerprint, then:
+        1. Team B rule group sets with no identical Team A set are deleted
+        2. Team A rule group sets with no identical Team B set are created
 
-        This is the same approach as parsing-rules and guarantees consistency.
+        Sets are independent of each other, so leaving the identical ones in place gives
+        the same end state as deleting and recreating everything. When nothing differs
+        the run returns before touching Team B.
 
         Returns:
             True if migration completed successfully
         """
         try:
             self.log_migration_start(self.service_name, dry_run=False)
+            self._clear_resource_caches()
+            # Failure counts belong to a single run, not to the service instance
+            self._failed_counts.clear()
 
             # Step 1: Fetch resources from both teams (with safety checks for TeamA)
             self.logger.info("📥 Fetching recording rule group sets from both teams...")
-            teama_resources = self.fetch_resources_from_teama()  # This includes safety checks
-            teamb_resources = self.fetch_resources_from_teamb()
+            teama_resources, teamb_resources = self._fetch_resources_from_both_teams()
 
             # Step 2: Create pre-migration version snapshot
             self.logger.info("📸 Creating pre-migration version snapshot...")
@@ -387,9 +515,38 @@ class RecordingRulesService(BaseService):
             self.save_artifacts(teama_resources, 'teama')
             self.save_artifacts(teamb_resources, 'teamb')
 
-            # Step 4: Perform mass deletion safety check (deleting ALL TeamB resources)
+            # Sets are independent of each other, so only the ones whose content differs
+            # between the teams need to be touched
+            to_create, to_delete = self._plan_changes(teama_resources, teamb_resources)
+
+            if not to_create and not to_delete:
+                self.logger.info(f"✨ No changes detected - Team B already matches Team A's {len(teama_resources)} rule group sets")
+                self._save_stats(MigrationStats(
+                    teama_count=len(teama_resources),
+                    teamb_before=len(teamb_resources),
+                    teamb_after=len(teamb_resources)
+                ))
+
+                # Team B is unchanged, so its fetched state is the final state
+                self.logger.info("💾 Saving final Team B state to outputs...")
+                self.save_artifacts(teamb_resources, "teamb_final")
+
+                self.logger.info("📸 Creating post-migration version snapshot...")
+                try:
+                    post_migration_version = self.version_manager.create_version_snapshot(
+                        teama_resources, teamb_resources, 'post_migration'
+                    )
+                    self.logger.info(f"Post-migration snapshot created: {post_migration_version}")
+                except Exception as e:
+                    self.logger.warning(f"Failed to create post-migration snapshot: {e}")
+
+                self.log_migration_complete(self.service_name, True, 0, 0)
+                print("\n✨ Recording rule group sets: no changes - Team B is already in sync with Team A\n")
+                return True
+
+            # Step 4: Perform mass deletion safety check
             mass_deletion_check = self.safety_manager.check_mass_deletion_safety(
-                teamb_resources, len(teamb_resources), len(teama_resources), previous_teama_count
+                to_delete, len(teamb_resources), len(teama_resources), previous_teama_count
             )
 
             if not mass_deletion_check.is_safe:
@@ -398,102 +555,127 @@ class RecordingRulesService(BaseService):
                 raise RuntimeError(f"Mass deletion safety check failed: {mass_deletion_check.reason}")
 
             self.logger.info(
-                "Migration plan - Delete ALL + Recreate ALL",
+                "Migration plan - Delete changed + Create changed",
                 total_teama_resources=len(teama_resources),
                 total_teamb_resources=len(teamb_resources),
-                to_delete=len(teamb_resources),
-                to_create=len(teama_resources)
+                to_delete=len(to_delete),
+                to_create=len(to_create),
+                unchanged=len(teamb_resources) - len(to_delete)
             )
 
-            delete_count = 0
-            create_success_count = 0
-            error_count = 0
+            stats = MigrationStats(teama_count=len(teama_resources), teamb_before=len(teamb_resources))
 
-            # Step 5: Delete ALL existing rule group sets from Team B
-            self.logger.info("🗑️ Deleting ALL existing recording rule group sets from Team B...")
+            # Step 5: Delete the Team B rule group sets that have no identical Team A counterpart
+            self.logger.info("🗑️ Deleting changed or removed recording rule group sets from Team B...")
 
-            if teamb_resources:
-                for teamb_resource in teamb_resources:
-                    try:
-                        resource_id = teamb_resource.get('id')
-                        resource_name = teamb_resource.get('name', 'Unknown')
+            deleted_ids = set()
+            if to_delete:
+                def _delete_one(resource_id):
+                    self._rate_limiter.acquire()
+                    return self.delete_resource_from_teamb(resource_id)
 
+                # Every delete goes to one pool; the token bucket paces the requests
+                with ThreadPoolExecutor(max_workers=self.max_concurrent_operations) as executor:
+                    futures = {}
+                    for teamb_resource in to_delete:
+                        resource_id = teamb_resource.get('id')
                         if resource_id:
-                            self.delete_resource_from_teamb(resource_id)
-                            self.logger.info(f"Deleted rule group set: {resource_name}")
-                            delete_count += 1
+                            futures[executor.submit(_delete_one, resource_id)] = teamb_resource
                         else:
-                            self.logger.error(f"Failed to delete rule group set: {resource_name} - no ID found")
-                            error_count += 1
-
-                    except Exception as e:
-                        self.logger.error(f"Failed to delete rule group set {teamb_resource.get('name', 'Unknown')}: {e}")
-                        error_count += 1
-
-                # Step 5.1: Verify deletion completed
-                self.logger.info("🔍 Verifying all rule group sets were deleted from Team B...")
-                time.sleep(2)  # Brief delay for API consistency
-                verification_teamb_resources = self.fetch_resources_from_teamb()
-
-                if verification_teamb_resources:
-                    self.logger.error(f"❌ Deletion verification failed: {len(verification_teamb_resources)} rule group sets still exist in Team B")
-                    for remaining in verification_teamb_resources:
-                        self.logger.error(f"   Remaining: {remaining.get('name', 'Unknown')} (ID: {remaining.get('id', 'N/A')})")
-                    raise RuntimeError(f"Failed to delete all rule group sets from Team B. {len(verification_teamb_resources)} still remain.")
+                            self.logger.error(f"Failed to delete rule group set: {teamb_resource.get('name', 'Unknown')} - no ID found")
+                            stats.failed += 1
+
+                    for future in as_completed(futures):
+                        teamb_resource = futures[future]
+                        resource_name = teamb_resource.get('name', 'Unknown')
+                        try:
+                            future.result()
+                            self.logger.info(f"Deleted rule group set: {resource_name}")
+                            deleted_ids.add(teamb_resource['id'])
+                            stats.deleted += 1
+                        except Exception as e:
+                            self.logger.error(f"Failed to delete rule group set {resource_name}: {e}")
+                            stats.failed += 1
+
+                # Step 5.1: Every delete returned success, so the responses already confirm
+                # the sets are gone. Only re-fetch to verify when some deletes failed.
+                if stats.deleted == len(to_delete):
+                    self.logger.info(f"✅ Deletion confirmed by API responses: {stats.deleted} rule group sets deleted from Team B")
                 else:
-                    self.logger.info("✅ Deletion verification passed: Team B is now empty")
+                    self.logger.info("🔍 Verifying rule group sets were deleted from Team B...")
+                    time.sleep(2)  # Brief delay for API consistency
+                    delete_ids = {r.get('id') for r in to_delete}
+                    remaining_resources = [
+                        r for r in self.fetch_resources_from_teamb() if r.get('id') in delete_ids
+                    ]
+
+                    if remaining_resources:
+                        self.logger.error(f"❌ Deletion verification failed: {len(remaining_resources)} rule group sets still exist in Team B")
+                        for remaining in remaining_resources:
+                            self.logger.error(f"   Remaining: {remaining.get('name', 'Unknown')} (ID: {remaining.get('id', 'N/A')})")
+                        raise RuntimeError(f"Failed to delete rule group sets from Team B. {len(remaining_resources)} still remain.")
+                    else:
+                        self.logger.info("✅ Deletion verification passed: changed rule group sets removed from Team B")
             else:
-                self.logger.info("ℹ️ Team B already has no rule group sets - skipping deletion")
-
-            # Step 6: Create ALL rule group sets from Team A
-            self.logger.info("📄 Creating ALL recording rule group sets from Team A...")
-
-            if teama_resources:
-                for teama_resource in teama_resources:
-                    try:
-                        resource_name = teama_resource.get('name', 'Unknown')
-
-                        self.logger.info(f"Creating rule group set: {resource_name}")
-                        self.create_resource_in_teamb(teama_resource)
-                        create_success_count += 1
-
-                    except Exception as e:
-                        self.logger.error(f"Failed to create rule group set {teama_resource.get('name', 'Unknown')}: {e}")
-                        error_count += 1
-
-                # Step 6.1: Verify creation completed
-                self.logger.info("🔍 Verifying all rule group sets were created in Team B...")
-                time.sleep(2)  # Brief delay for API consistency
-                final_teamb_resources = self.fetch_resources_from_teamb()
-
+                self.logger.info("ℹ️ No Team B rule group sets need deleting - skipping deletion")
+
+            unchanged_teamb_resources = [r for r in teamb_resources if r.get('id') not in deleted_ids]
+
+            # Step 6: Create the Team A rule group sets that are missing from Team B
+            self.logger.info("📄 Creating new or changed recording rule group sets from Team A...")
+
+            if to_create:
+                created_resources = []
+                # create_resource_in_teamb takes its own rate limiter token
+                with ThreadPoolExecutor(max_workers=self.max_concurrent_operations) as executor:
+                    futures = {executor.submit(self.create_resource_in_teamb, teama_resource): teama_resource
+                               for teama_resource in to_create}
+
+                    for future in as_completed(futures):
+                        teama_resource = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Failed to create rule group set {teama_resource.get('name', 'Unknown')}: {e}")
+                            stats.failed += 1
+                            continue
+
+                        stats.created += 1
+                        # The create response carries the Team B id; it overrides Team A's
+                        created = dict(self._prepare_resource_for_creation(teama_resource))
+                        if isinstance(result, dict):
+                            created.update(result)
+                        created_resources.append(created)
+
+                # Step 6.1: Every call returned success, so Team B's final state is the unchanged
+                # sets plus what was created. Only re-fetch to verify when some call failed.
                 expected_count = len(teama_resources)
+                if stats.created == len(to_create) and stats.failed == 0:
+                    self.logger.info(f"✅ Creation confirmed by API responses: {stats.created} rule group sets created in Team B")
+                    final_teamb_resources = unchanged_teamb_resources + created_resources
+                else:
+                    self.logger.info("🔍 Verifying all rule group sets were created in Team B...")
+                    time.sleep(2)  # Brief delay for API consistency
+                    final_teamb_resources = self.fetch_resources_from_teamb()
+
                 actual_count = len(final_teamb_resources)
 
                 if actual_count != expected_count:
                     self.logger.error(f"❌ Creation verification failed: Expected {expected_count} rule group sets, but found {actual_count} in Team B")
                     raise RuntimeError(f"Creation verification failed: Expected {expected_count} rule group sets, but found {actual_count}")
                 else:
-                    self.logger.info(f"✅ Creation verification passed: {actual_count} rule group sets successfully created in Team B")
-
-                    # Save final state to outputs
-                    self.logger.info("💾 Saving final Team B state to outputs...")
-                    self.save_artifacts(final_teamb_resources, "teamb_final")
+                    self.logger.info(f"✅ Creation verification passed: {actual_count} rule group sets in Team B")
             else:
-                self.logger.info("ℹ️ Team A has no rule group sets - skipping creation")
-                final_teamb_resources = []
+                self.logger.info("ℹ️ No Team A rule group sets need creating - skipping creation")
+                final_teamb_resources = unchanged_teamb_resources
+
+            # Save final state to outputs
+            self.logger.info("💾 Saving final Team B state to outputs...")
+            self.save_artifacts(final_teamb_resources, "teamb_final")
 
             # Step 7: Save migration statistics for summary table
-            stats_file = self.outputs_dir / f"{self.service_name}_stats_latest.json"
-            stats_data = {
-                'teama_count': len(teama_resources),
-                'teamb_before': len(teamb_resources),
-                'teamb_after': len(final_teamb_resources),
-                'created': create_success_count,
-                'deleted': delete_count,
-                'failed': error_count
-            }
-            with open(stats_file, 'w') as f:
-                json.dump(stats_data, f, indent=2)
+            stats.teamb_after = len(final_teamb_resources)
+            self._save_stats(stats)
 
             # Step 8: Create post-migration version snapshot
             self.logger.info("📸 Creating post-migration version snapshot...")
@@ -506,12 +688,12 @@ class RecordingRulesService(BaseService):
                 self.logger.warning(f"Failed to create post-migration snapshot: {e}")
 
             # Log completion
-            migration_success = error_count == 0
+            migration_success = stats.failed == 0
             self.log_migration_complete(
                 self.service_name,
                 migration_success,
-                create_success_count,
-                error_count
+                stats.created,
+                stats.failed
             )
 
             # Print user-visible migration summary
@@ -521,16 +703,16 @@ class RecordingRulesService(BaseService):
             print(f"📊 Team A rule group sets: {len(teama_resources)}")
             print(f"📊 Team B rule group sets (before): {len(teamb_resources)}")
             print(f"📊 Team B rule group sets (after): {len(final_teamb_resources)}")
-            print(f"🗑️  Deleted from Team B: {delete_count}")
-            print(f"✅ Successfully created: {create_success_count}")
-            if error_count > 0:
-                print(f"❌ Failed: {error_count}")
-            print(f"📋 Total operations: {delete_count + create_success_count + error_count}")
+            print(f"🗑️  Deleted from Team B: {stats.deleted}")
+            print(f"✅ Successfully created: {stats.created}")
+            if stats.failed > 0:
+                print(f"❌ Failed: {stats.failed}")
+            print(f"📋 Total operations: {stats.deleted + stats.created + stats.failed}")
 
             if migration_success:
                 print("\n✅ Migration completed successfully!")
             else:
-                print(f"\n⚠️ Migration completed with {error_count} failures")
+                print(f"\n⚠️ Migration completed with {stats.failed} failures")
 
             print("=" * 60 + "\n")
 
@@ -540,10 +722,13 @@ class RecordingRulesService(BaseService):
             self.logger.error(f"Migration failed: {e}")
             self.log_migration_complete(self.service_name, False, 0, 1)
             return False
+        finally:
+            # Failures logged before an aborted run still get their summary
+            self._write_failed_rule_group_sets_summary()
 
     def dry_run(self) -> bool:
         """
-        Perform a dry run of the recording rule group sets migration using delete & recreate all pattern.
+        Perform a dry run of the recording rule group sets migration.
         Shows what would be done without making actual changes.
 
         Returns:
@@ -551,20 +736,21 @@ class RecordingRulesService(BaseService):
         """
         try:
             self.log_migration_start(self.service_name, dry_run=True)
+            self._clear_resource_caches()
+            # Failure counts belong to a single run, not to the service instance
+            self._failed_counts.clear()
 
             # Fetch current resources from both teams
-            self.logger.info("Fetching resources from Team A...")
-            teama_resources = self.fetch_resources_from_teama()
-
-            self.logger.info("Fetching resources from Team B...")
-            teamb_resources = self.fetch_resources_from_teamb()
+            self.logger.info("Fetching resources from Team A and Team B...")
+            teama_resources, teamb_resources = self._fetch_resources_from_both_teams()
 
             # Save artifacts for comparison
             self.save_artifacts(teama_resources, 'teama')
             self.save_artifacts(teamb_resources, 'teamb')
 
-            # Calculate what would be done (delete all + recreate all)
-            total_operations = len(teamb_resources) + len(teama_resources)
+            # Calculate what would be done (delete changed + create changed)
+            to_create, to_delete = self._plan_changes(teama_resources, teamb_resources)
+            total_operations = len(to_delete) + len(to_create)
 
             # Print dry-run summary
             print("\n" + "=" * 60)
@@ -573,8 +759,9 @@ class RecordingRulesService(BaseService):
             print(f"📊 Team A rule group sets: {len(teama_resources)}")
             print(f"📊 Team B rule group sets (current): {len(teamb_resources)}")
             print("\n🔄 Planned Operations:")
-            print(f"   🗑️  Delete ALL {len(teamb_resources)} rule group sets from Team B")
-            print(f"   ✅ Create {len(teama_resources)} rule group sets from Team A")
+            print(f"   🗑️  Delete {len(to_delete)} changed or removed rule group sets from Team B")
+            print(f"   ✅ Create {len(to_create)} new or changed rule group sets from Team A")
+            print(f"   ✨ Leave {len(teamb_resources) - len(to_delete)} unchanged rule group sets in place")
             print(f"\n📋 Total operations: {total_operations}")
             print("=" * 60 + "\n")
 
@@ -588,17 +775,12 @@ class RecordingRulesService(BaseService):
                 print()
 
             # Save migration statistics for summary table
-            stats_file = self.outputs_dir / f"{self.service_name}_stats_latest.json"
-            stats_data = {
-                'teama_count': len(teama_resources),
-                'teamb_before': len(teamb_resources),
-                'teamb_after': len(teamb_resources),  # No change in dry run
-                'created': 0,  # Dry run doesn't create
-                'deleted': 0,  # Dry run doesn't delete
-                'failed': 0
-            }
-            with open(stats_file, 'w') as f:
-                json.dump(stats_data, f, indent=2)
+            # No change in dry run, so nothing is created, deleted or failed
+            self._save_stats(MigrationStats(
+                teama_count=len(teama_resources),
+                teamb_before=len(teamb_resources),
+                teamb_after=len(teamb_resources)
+            ))
 
             self.log_migration_complete(self.service_name, True, 0, 0)
             return True
@@ -647,183 +829,3 @@ class RecordingRulesService(BaseService):
             print("✨ No changes detected - Team B is already in sync with Team A")
 
         print("=" * 60)
-
-    def _display_migration_results_table(self, migration_stats: Dict):
-        """Display migration results in a nice tabular format."""
-        # Use print() to bypass JSON logging and show clean table
-        print("\n" + "=" * 80)
-        print("🎉 RECORDING RULES MIGRATION RESULTS")
-        print("=" * 80)
-
-        # Prepare migration results table
-        migration_table_data = []
-
-        # Add operations breakdown
-        if migration_stats['new_resources'] > 0:
-            success_rate = (migration_stats['successful_operations'] / migration_stats['total_operations'] * 100) if migration_stats['total_operations'] > 0 else 100
-            migration_table_data.append({
-                'operation_type': 'New Rule Group Sets',
-                'planned': migration_stats['new_resources'],
-                'successful': min(migration_stats['new_resources'], migration_stats['successful_operations']),
-                'failed': max(0, migration_stats['new_resources'] - migration_stats['successful_operations']),
-                'success_rate': f"{success_rate:.1f}%"
-            })
-
-        if migration_stats['changed_resources'] > 0:
-            success_rate = (migration_stats['successful_operations'] / migration_stats['total_operations'] * 100) if migration_stats['total_operations'] > 0 else 100
-            migration_table_data.append({
-                'operation_type': 'Changed Rule Group Sets',
-                'planned': migration_stats['changed_resources'],
-                'successful': min(migration_stats['changed_resources'], migration_stats['successful_operations']),
-                'failed': max(0, migration_stats['changed_resources'] - migration_stats['successful_operations']),
-                'success_rate': f"{success_rate:.1f}%"
-            })
-
-        if migration_stats['deleted_resources'] > 0:
-            success_rate = (migration_stats['successful_operations'] / migration_stats['total_operations'] * 100) if migration_stats['total_operations'] > 0 else 100
-            migration_table_data.append({
-                'operation_type': 'Deleted Rule Group Sets',
-                'planned': migration_stats['deleted_resources'],
-                'successful': min(migration_stats['deleted_resources'], migration_stats['successful_operations']),
-                'failed': max(0, migration_stats['deleted_resources'] - migration_stats['successful_operations']),
-                'success_rate': f"{success_rate:.1f}%"
-            })
-
-        # Display migration results table
-        if migration_table_data:
-            self._display_table(migration_table_data)
-
-        # Display overall summary
-        overall_success_rate = (migration_stats['successful_operations'] / migration_stats['total_operations'] * 100) if migration_stats['total_operations'] > 0 else 100
-
-        print("")
-        print("📊 OVERALL MIGRATION SUMMARY")
-        print("─" * 40)
-        print(f"{'Team A Rule Group Sets:':<25} {migration_stats['total_teama_resources']:>10}")
-        print(f"{'Team B Rule Group Sets:':<25} {migration_stats['total_teamb_resources']:>10}")
-        print(f"{'Total Operations:':<25} {migration_stats['total_operations']:>10}")
-        print(f"{'Successful Operations:':<25} {migration_stats['successful_operations']:>10}")
-        print(f"{'Failed Operations:':<25} {migration_stats['failed_operations']:>10}")
-        print(f"{'Overall Success Rate:':<25} {overall_success_rate:>9.1f}%")
-        print("=" * 80)
-
-    def _display_table(self, table_data: List[Dict[str, Any]]):
-        """Display migration results in a nice tabular format."""
-        # Table headers
-        headers = [
-            "Operation Type",
-            "Planned",
-            "Successful",
-            "Failed",
-            "Success Rate"
-        ]
-
-        # Calculate column widths
-        col_widths = []
-        for i, header in enumerate(headers):
-            max_width = len(header)
-            for row in table_data:
-                if i == 0:
-                    max_width = max(max_width, len(row['operation_type']))
-                elif i == 1:
-                    max_width = max(max_width, len(str(row['planned'])))
-                elif i == 2:
-                    max_width = max(max_width, len(str(row['successful'])))
-                elif i == 3:
-                    max_width = max(max_width, len(str(row['failed'])))
-                elif i == 4:
-                    max_width = max(max_width, len(row['success_rate']))
-            col_widths.append(max_width)
-
-        # Create table borders
-        top_border = "┌"
-        header_border = "├"
-        bottom_border = "└"
-
-        for i, width in enumerate(col_widths):
-            if i > 0:
-                top_border += "┬"
-                header_border += "┼"
-                bottom_border += "┴"
-            top_border += "─" * (width + 2)
-            header_border += "─" * (width + 2)
-            bottom_border += "─" * (width + 2)
-
-        top_border += "┐"
-        header_border += "┤"
-        bottom_border += "┘"
-
-        # Use print() to bypass JSON logging and show clean table
-        print(top_border)
-
-        # Print headers
-        header_row = "│"
-        for i, header in enumerate(headers):
-            if i == 0:  # Operation type - left aligned
-                header_row += f" {header:<{col_widths[i]}} │"
-            else:  # Numbers and percentages - right aligned
-                header_row += f" {header:>{col_widths[i]}} │"
-
-        print(header_row)
-        print(header_border)
-
-        # Print data rows
-        for row in table_data:
-            data_row = "│"
-            values = [
-                row['operation_type'],
-                str(row['planned']),
-                str(row['successful']),
-                str(row['failed']),
-                row['success_rate']
-            ]
-
-            for i, value in enumerate(values):
-                if i == 0:  # Operation type - left aligned
-                    data_row += f" {value:<{col_widths[i]}} │"
-                else:  # Numbers and percentages - right aligned
-                    data_row += f" {value:>{col_widths[i]}} │"
-
-            print(data_row)
-
-        print(bottom_border)
-
-    def _compare_rule_group_sets(self, teama_resources: List[Dict[str, Any]], teamb_resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Compare rule group sets between Team A and Team B to identify changes.
-
-        Returns:
-            Dictionary with:
-            - new_in_teama: Resources that exist in Team A but not in Team B
-            - changed_resources: Resources that exist in both but are different
-            - deleted_from_teama: Resources that exist in Team B but not in Team A
-        """
-        # Create lookup dictionaries by name (rule group sets are identified by name)
-        teama_by_name = {resource.get('name'): resource for resource in teama_resources}
-        teamb_by_name = {resource.get('name'): resource for resource in teamb_resources}
-
-        new_in_teama = []
-        changed_resources = []
-        deleted_from_teama = []
-
-        # Find new and changed resources
-        for name, teama_resource in teama_by_name.items():
-            if name not in teamb_by_name:
-                # Resource exists in Team A but not in Team B - new
-                new_in_teama.append(teama_resource)
-            else:
-                # Resource exists in both teams - check if changed
-                teamb_resource = teamb_by_name[name]
-                if not self.resources_are_equal(teama_resource, teamb_resource):
-                    changed_resources.append((teama_resource, teamb_resource))
-
-        # Find deleted resources (exist in Team B but not in Team A)
-        for name, teamb_resource in teamb_by_name.items():
-            if name not in teama_by_name:
-                deleted_from_teama.append(teamb_resource)
-
-        return {
-            'new_in_teama': new_in_teama,
-            'changed_resources': changed_resources,
-            'deleted_from_teama': deleted_from_teama
-        }
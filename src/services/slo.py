@@ -5,10 +5,12 @@ SLO migration service for Coralogix DR Tool.
 import time
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 from core.base_service import BaseService
+from core.rate_limiter import TokenBucket
 from core.safety_manager import SafetyManager
 from core.version_manager import VersionManager
 
@@ -23,6 +25,10 @@ class SLOService(BaseService):
         self.safety_manager = SafetyManager(config, self.service_name)
         self.version_manager = VersionManager(config, self.service_name)
 
+        # Deletions run on a bounded worker pool, paced by a token bucket instead of fixed sleeps
+        self.max_concurrent_deletes = max(1, config.slo_delete_parallelism)
+        self._rate_limiter = TokenBucket(rate=config.api_rate_limit_per_second, capacity=20)
+
     @property
     def service_name(self) -> str:
         return "slo"
@@ -171,28 +177,33 @@ class SLOService(BaseService):
 
         self.logger.info(f"Deleting {len(teamb_slos)} SLOs from Team B...")
 
-        for slo in teamb_slos:
-            try:
-                slo_id = self.get_slo_id(slo)
-                slo_name = slo.get('name', 'Unknown')
+        def _delete_one(slo_id):
+            self._rate_limiter.acquire()
+            return self.delete_resource_from_teamb(slo_id)
 
+        # SLO deletions are independent, so they run concurrently on a bounded pool
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_deletes) as executor:
+            futures = {}
+            for slo in teamb_slos:
+                slo_id = self.get_slo_id(slo)
                 if slo_id:
-                    if self.delete_resource_from_teamb(slo_id):
+                    futures[executor.submit(_delete_one, slo_id)] = slo
+                else:
+                    stats['failed'] += 1
+                    self.logger.error(f"❌ Could not extract ID for SLO: {slo.get('name', 'Unknown')}")
+
+            for future in as_completed(futures):
+                slo_name = futures[future].get('name', 'Unknown')
+                try:
+                    if future.result():
                         stats['deleted'] += 1
                         self.logger.debug(f"✅ Deleted SLO: {slo_name}")
                     else:
                         stats['failed'] += 1
                         self.logger.error(f"❌ Failed to delete SLO: {slo_name}")
-                else:
+                except Exception as e:
                     stats['failed'] += 1
-                    self.logger.error(f"❌ Could not extract ID for SLO: {slo_name}")
-
-                # Add delay between deletions
-                self._add_creation_delay()
-
-            except Exception as e:
-                stats['failed'] += 1
-                self.logger.error(f"❌ Exception deleting SLO {slo.get('name', 'Unknown')}: {e}")
+                    self.logger.error(f"❌ Exception deleting SLO {slo_name}: {e}")
 
         self.logger.info(f"Deletion complete: {stats['deleted']}/{stats['total']} deleted, {stats['failed']} failed")
         return stats